@@ -16,7 +16,8 @@ economic simulation.
 
 import uuid
 import random
-from .game_data import SHIP_CLASSES, MODULE_SPECS, GOODS, ILLEGAL_GOODS, FACTIONS, PRODUCTION_RECIPES, FACTION_RANKS
+from bisect import insort
+from .game_data import SHIP_CLASSES, MODULE_SPECS, BASE_PRICES, FACTIONS, PRODUCTION_RECIPES, FACTION_RANKS
 
 class Mission:
     """
@@ -69,7 +70,7 @@ class Mission:
             self.reward_credits = 5000
             self.reward_reputation = 25
         else:
-            base_good_price = GOODS.get(good, ILLEGAL_GOODS.get(good, {"base_price": 0}))["base_price"]
+            base_good_price = BASE_PRICES.get(good, 0)
             distance = 1 # Simplified for now
             self.reward_credits = int((base_good_price * quantity * 0.5) + (distance * 100))
             self.reward_reputation = 10
@@ -338,6 +339,30 @@ class StarSystem:
         self.has_black_market = False
         self.recruitment_office = []
 
+    def on_discovered(self, rng=random):
+        """Marks an uncharted system as discovered and rolls its exploration properties.
+        
+        Args:
+            rng: Random source for the rolls; defaults to the shared random module
+        """
+        self.discovered = True
+        if hasattr(self, 'discovery_bonus'):
+            return  # Already rolled
+        
+        self.discovery_bonus = rng.randint(500, 2000)
+        self.exploration_danger = rng.uniform(0.3, 0.8)
+        
+        # Ancient ruins have artifacts
+        if self.system_type == "ancient_ruins":
+            self.has_artifacts = True
+            self.artifacts_remaining = rng.randint(1, 3)
+            
+        # Resource rich systems have special goods
+        if self.system_type == "resource_rich":
+            self.special_resource = rng.choice([
+                "Quantum Crystals", "Dark Matter", "Neutronium", "Exotic Particles"
+            ])
+
 class Ship:
     """
     Represents the player's starship, composed of a hull and various modules.
@@ -378,6 +403,22 @@ class Ship:
     def max_hull(self):
         return self.ship_class_data["base_hull"]
 
+    @property
+    def cargo_hold(self):
+        return self._cargo_hold
+
+    @cargo_hold.setter
+    def cargo_hold(self, cargo):
+        # Whole-hold replacement (e.g. loading a save) resyncs the running total
+        self._cargo_hold = cargo
+        self._cargo_used = sum(cargo.values())
+        self._cargo_goods = sorted(cargo)
+
+    @property
+    def cargo_used(self):
+        """Total units in the cargo hold, maintained by add/remove_cargo."""
+        return self._cargo_used
+
     @property
     def cargo_capacity(self):
         # Base capacity from ship class
@@ -419,14 +460,25 @@ class Ship:
         return total_damage + officer_bonus
 
     def get_cargo_used(self):
-        return sum(self.cargo_hold.values())
+        return self._cargo_used
+    def sorted_cargo(self):
+        """Returns (good, quantity) pairs for the hold in name order."""
+        return [(good, self._cargo_hold[good]) for good in self._cargo_goods]
     def add_cargo(self, good, quantity):
-        self.cargo_hold[good] = self.cargo_hold.get(good, 0) + quantity
+        if good not in self._cargo_hold:
+            insort(self._cargo_goods, good)
+        self._cargo_hold[good] = self._cargo_hold.get(good, 0) + quantity
+        self._cargo_used += quantity
     def remove_cargo(self, good, quantity):
-        if good in self.cargo_hold:
-            self.cargo_hold[good] -= quantity
-            if self.cargo_hold[good] <= 0:
-                del self.cargo_hold[good]
+        if good in self._cargo_hold:
+            held = self._cargo_hold[good]
+            if held <= quantity:
+                del self._cargo_hold[good]
+                self._cargo_goods.remove(good)
+                self._cargo_used -= held
+            else:
+                self._cargo_hold[good] = held - quantity
+                self._cargo_used -= quantity
     
     def gain_experience(self, category, amount):
         """Add experience to a category and check for specialization/level up."""
@@ -459,6 +511,11 @@ class Ship:
         # 10% bonus per level above 1
         return 1.0 + (self.level - 1) * 0.1
 
+
+# Star bar shown for each wanted level; levels are capped at 5
+WANTED_STARS = tuple('★' * level for level in range(6))
+
+
 class Player:
     """
     Represents the player.
@@ -668,7 +725,7 @@ class Player:
             
             if new_level > current:
                 print(f"\n--- WANTED LEVEL INCREASED ---")
-                print(f"You are now wanted by the {faction}! Wanted level: {'★' * new_level}")
+                print(f"You are now wanted by the {faction}! Wanted level: {WANTED_STARS[new_level]}")
                 
                 if new_level >= 3:
                     print("WARNING: Bounty hunters may now pursue you!")
@@ -680,7 +737,7 @@ class Player:
             
             if self.wanted_level > old_level:
                 print(f"\n--- WANTED LEVEL INCREASED ---")
-                print(f"Your criminal notoriety has increased! Wanted level: {'★' * self.wanted_level}")
+                print(f"Your criminal notoriety has increased! Wanted level: {WANTED_STARS[self.wanted_level]}")
                 
                 if self.wanted_level >= 3:
                     print("WARNING: Bounty hunters are now actively seeking you!")
@@ -698,6 +755,25 @@ class Player:
             if self.wanted_level == 0:
                 print("Your wanted status has been cleared.")
     
+    def apply_penalty(self, fine=0, faction=None, reputation=0, wanted=0, confiscate=()):
+        """Apply a confiscation, fine, reputation loss and wanted increase in one update."""
+        ship = self.ship
+        for good, quantity in confiscate:
+            ship.remove_cargo(good, quantity)
+        self.credits -= fine
+        if faction and reputation:
+            self.add_reputation(faction, reputation)
+        if wanted:
+            self.increase_wanted_level(faction, wanted)
+    
+    def apply_reward(self, credits=0, ship_xp=None, crew_xp=None):
+        """Grant credits plus optional (category, amount) ship and (role, amount) crew experience."""
+        self.credits += credits
+        if ship_xp:
+            self.ship.gain_experience(*ship_xp)
+        if crew_xp:
+            self.give_crew_experience(*crew_xp)
+    
     def get_total_wanted_level(self):
         """Get the effective wanted level considering all factions."""
         faction_max = max(self.wanted_by.values()) if self.wanted_by else 0
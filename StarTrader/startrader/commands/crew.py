@@ -93,7 +93,7 @@ class CrewCommands(BaseCommandHandler):
         # Hire the crew member
         self.player.credits -= recruit.hire_cost
         self.player.crew.append(recruit)
-        self.game.available_recruits.remove(recruit)
+        del self.game.available_recruits[recruit_num]
         
         print(f"Hired {recruit.name} as {recruit.role} for {recruit.hire_cost} credits.")
         print(f"Your crew now has {len(self.player.crew)} members.")
@@ -157,7 +157,7 @@ class CrewCommands(BaseCommandHandler):
         if input().strip().lower() != 'y':
             return
         
-        self.player.crew.remove(member)
+        del self.player.crew[crew_num]
         print(f"{member.name} has been dismissed.")
         
         # Morale penalty
@@ -54,7 +54,7 @@ class MissionCommands(BaseCommandHandler):
         
         # Accept the mission
         self.player.active_missions.append(mission)
-        system.available_missions.remove(mission)
+        del system.available_missions[mission_num]
         mission.expiration_day = self.game.current_day + mission.time_limit
         
         # Add cargo for DELIVER missions
@@ -21,13 +21,11 @@ class NavigationCommands(BaseCommandHandler):
         
         if destination_name not in self.galaxy.systems:
             # Allow for short names
-            for system_name_i in self.galaxy.systems:
-                if destination_name.lower() in system_name_i.lower():
-                    destination_name = system_name_i
-                    break
-            else:
+            short_match = self.galaxy.find_system_name(destination_name)
+            if short_match is None:
                 print(f"Unknown system: '{destination_name}'")
                 return
+            destination_name = short_match
         
         current_system = self.player.location
         if current_system.name == destination_name:
@@ -163,29 +161,15 @@ class NavigationCommands(BaseCommandHandler):
             undiscovered = [s for s in self.galaxy.uncharted_systems.values() if not s.discovered]
             if undiscovered:
                 discovered_system = random.choice(undiscovered)
-                discovered_system.discovered = True
+                discovered_system.on_discovered()
                 
                 print(f"\n--- DISCOVERY ---")
                 print(f"You've discovered {discovered_system.name}!")
                 print(f"Type: {discovered_system.system_type.replace('_', ' ').title()}")
                 print(f"Description: {discovered_system.description}")
                 
-                # Add to main galaxy
-                self.galaxy.systems[discovered_system.name] = discovered_system
-                
-                # Create connections to nearby systems
-                current = self.player.location
-                self.galaxy.connections[current.name].append(discovered_system.name)
-                self.galaxy.connections[discovered_system.name] = [current.name]
-                
-                # Calculate fuel cost
-                distance = self.galaxy._calculate_distance(current, discovered_system)
-                fuel_cost = int(distance * 5)
-                self.galaxy.fuel_costs[(current.name, discovered_system.name)] = fuel_cost
-                self.galaxy.fuel_costs[(discovered_system.name, current.name)] = fuel_cost
-                
-                # Generate market for the new system
-                self.galaxy._generate_markets()
+                # Add to main galaxy, connected to where it was found
+                self.galaxy.add_discovered_system(discovered_system, self.player.location)
                 
                 # Reward
                 self.player.credits += discovered_system.discovery_bonus
@@ -242,8 +226,9 @@ class NavigationCommands(BaseCommandHandler):
         found_anomaly = False
         for uncharted in self.galaxy.uncharted_systems.values():
             if not uncharted.discovered:
-                distance = self.galaxy._calculate_distance(system, uncharted)
-                if distance <= 3:  # Can detect systems within 3 units
+                dx, dy = system.x - uncharted.x, system.y - uncharted.y
+                if dx * dx + dy * dy <= 9:  # Can detect systems within 3 units
+                    distance = self.galaxy._calculate_distance(system, uncharted)
                     print(f"- Anomaly detected {distance:.1f} units away")
                     found_anomaly = True
                     break
@@ -89,7 +89,8 @@ class ShipCommands(BaseCommandHandler):
         
         module_name = " ".join(parts[1:]).title()
         
-        if module_name not in MODULE_SPECS:
+        module_data = MODULE_SPECS.get(module_name)
+        if module_data is None:
             print(f"Unknown module: '{module_name}'")
             print(f"Available modules: {', '.join(MODULE_SPECS.keys())}")
             return
@@ -100,7 +101,6 @@ class ShipCommands(BaseCommandHandler):
             print(f"Your ship already has the {module_name} module.")
             return
         
-        module_data = MODULE_SPECS[module_name]
         cost = module_data["price"]
         
         if self.player.credits < cost:
@@ -67,18 +67,19 @@ class TradingCommands(BaseCommandHandler):
         total_cost = market_data["price"] * quantity
         
         # Apply trading bonuses
-        total_bonus = self.game.calculate_trade_bonus()
+        negotiator_bonus, skill_bonus, ship_bonus = self.game.get_trade_bonus_sources()
+        total_bonus = negotiator_bonus + skill_bonus + ship_bonus
         
         if total_bonus > 0:
             savings = int(market_data['price'] * quantity * total_bonus)
             total_cost *= (1 - total_bonus)
             total_cost = int(total_cost)
             # Show appropriate message based on bonus sources
-            if ship.specialization == "trading" and ship.level > 1:
+            if ship_bonus > 0:
                 print(f"Your specialized trading ship negotiates better deals!")
-            if self.player.get_skill_bonus("negotiation") > 0:
+            if skill_bonus > 0:
                 print(f"Your negotiation skills save you {savings} credits!")
-            elif self.player.get_crew_bonus("Negotiator") > 0:
+            elif negotiator_bonus > 0:
                 print(f"Your negotiator secured a better price! You save {savings} credits.")
         
         # Apply reputation effects
@@ -90,8 +91,9 @@ class TradingCommands(BaseCommandHandler):
             return
         
         # Check cargo space
-        if ship.get_cargo_used() + quantity > ship.cargo_capacity:
-            print(f"Not enough cargo space. You need {quantity} slots, but only have {ship.cargo_capacity - ship.get_cargo_used()} free.")
+        free_space = ship.cargo_capacity - ship.get_cargo_used()
+        if quantity > free_space:
+            print(f"Not enough cargo space. You need {quantity} slots, but only have {free_space} free.")
             return
         
         # Execute transaction
@@ -146,17 +148,18 @@ class TradingCommands(BaseCommandHandler):
         total_sale = market_data["price"] * quantity
         
         # Apply trading bonuses
-        total_bonus = self.game.calculate_trade_bonus()
+        negotiator_bonus, skill_bonus, ship_bonus = self.game.get_trade_bonus_sources()
+        total_bonus = negotiator_bonus + skill_bonus + ship_bonus
         
         if total_bonus > 0:
             bonus_amount = int(total_sale * total_bonus)
             total_sale += bonus_amount
             # Show appropriate message based on bonus sources
-            if ship.specialization == "trading" and ship.level > 1:
+            if ship_bonus > 0:
                 print(f"Your specialized trading ship commands premium prices!")
-            if self.player.get_skill_bonus("negotiation") > 0:
+            if skill_bonus > 0:
                 print(f"Your negotiation skills earn you an extra {bonus_amount} credits!")
-            elif self.player.get_crew_bonus("Negotiator") > 0:
+            elif negotiator_bonus > 0:
                 print(f"Your negotiator secured a better price! You earn an extra {bonus_amount} credits.")
         
         # Apply reputation effects
@@ -13,6 +13,9 @@ FACTIONS = {
     "Corporation": {"name": "MegaCorp Consortium", "type": "corporate"}
 }
 
+# Factions that hold territory, wage wars and post bounties
+MAJOR_FACTIONS = tuple(faction for faction in FACTIONS if faction != "Independent")
+
 # Faction rank progressions
 FACTION_RANKS = {
     "Federation": [
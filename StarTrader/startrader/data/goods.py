@@ -1,7 +1,7 @@
 """
 Trade goods and production data for Star Trader.
 
-Contains all legal and illegal goods, as well as production recipes.
+Contains all legal and illegal goods, their merged base prices, and production recipes.
 """
 
 # Legal trade goods
@@ -33,6 +33,10 @@ ILLEGAL_GOODS = {
     "Stolen Goods": {"base_price": 1000, "category": "contraband"}
 }
 
+# Base price of every legal and illegal good, for single-lookup price checks
+BASE_PRICES = {good: data["base_price"] for good, data in GOODS.items()}
+BASE_PRICES.update({good: data["base_price"] for good, data in ILLEGAL_GOODS.items()})
+
 # Production recipes for factories
 PRODUCTION_RECIPES = {
     "Rations": {
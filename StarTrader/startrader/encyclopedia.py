@@ -5,7 +5,7 @@ Provides in-game documentation and reference information about goods,
 factions, ships, modules, production, exploration, ranks, and game mechanics.
 """
 
-from .game_data import (GOODS, ILLEGAL_GOODS, FACTIONS, FACTION_RANKS, 
+from .game_data import (GOODS, ILLEGAL_GOODS, BASE_PRICES, FACTIONS, FACTION_RANKS, 
                        SHIP_CLASSES, MODULE_SPECS, PRODUCTION_RECIPES)
 from .constants import (TRADING_SHIP_BONUS_PER_LEVEL, FLEE_BASE_CHANCE,
                        FLEE_PILOTING_MULTIPLIER, BOARDING_BASE_CHANCE,
@@ -386,7 +386,7 @@ class Encyclopedia:
         print(f"\nOutput: {recipe['output_quantity']} units of {product_name}")
         
         # Calculate profitability
-        input_cost = sum(GOODS.get(good, ILLEGAL_GOODS.get(good, {})).get("base_price", 0) * amt 
+        input_cost = sum(BASE_PRICES.get(good, 0) * amt 
                         for good, amt in recipe["inputs"].items())
         output_value = GOODS.get(product_name, {}).get("base_price", 0) * recipe["output_quantity"]
         profit = output_value - input_cost
@@ -36,7 +36,7 @@ class EventTrigger(Enum):
     CONDITIONAL = "conditional"
 
 
-@dataclass
+@dataclass(slots=True)
 class EventConfig:
     """Configuration for an event."""
     id: str
@@ -54,6 +54,8 @@ class EventConfig:
 class Event:
     """Base class for all game events."""
     
+    __slots__ = ('config', 'occurrences', 'last_triggered_day')
+    
     def __init__(self, config: EventConfig):
         """Initialize the event with its configuration.
         
@@ -222,9 +224,10 @@ class EventRegistry:
         Args:
             event: The event to register
         """
-        self.events[event.config.id] = event
-        self.events_by_trigger[event.config.trigger].append(event)
-        self.events_by_type[event.config.event_type].append(event)
+        config = event.config
+        self.events[config.id] = event
+        self.events_by_trigger[config.trigger].append(event)
+        self.events_by_type[config.event_type].append(event)
     
     def unregister(self, event_id: str) -> None:
         """Remove an event from the registry.
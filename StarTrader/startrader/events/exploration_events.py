@@ -4,7 +4,8 @@ Exploration-related events for Star Trader.
 Events that can occur while exploring uncharted space.
 """
 
-import random
+import sys
+from random import random as _rand, randint as _randint, choice as _choice
 from typing import TYPE_CHECKING
 from ..event_system import Event, EventConfig, EventType, EventTrigger, EventRegistry
 
@@ -12,24 +13,36 @@ if TYPE_CHECKING:
     from ..main import Game
 
 
+def _emit(*lines: str) -> None:
+    """Write several lines to stdout in a single call."""
+    sys.stdout.write("\n".join(lines))
+    sys.stdout.write("\n")
+
+
+def _yes(prompt: str) -> bool:
+    """Ask a y/n question and return True for any answer starting with y/Y."""
+    answer = input(prompt)
+    return bool(answer) and answer[0] in 'yY'
+
+
 class DebrisFieldEvent(Event):
     """Discover a debris field from an old battle."""
     
+    __slots__ = ()
+    
     def _execute(self, game: 'Game', context: dict) -> bool:
         """Execute debris field exploration."""
-        print("\nThe debris appears to be from merchant vessels.")
-        choice = input("Search for salvage? (y/n) > ").lower()
-        
-        if choice == 'y':
-            if random.random() < 0.5:
-                credits = random.randint(100, 500)
+        _emit("", "The debris appears to be from merchant vessels.")
+        if _yes("Search for salvage? (y/n) > "):
+            if _rand() < 0.5:
+                credits = _randint(100, 500)
                 game.player.credits += credits
-                print(f"\nYou salvage {credits} credits worth of components!")
+                _emit("", f"You salvage {credits} credits worth of components!")
                 game.player.ship.gain_experience("exploration", 2)
             else:
-                damage = random.randint(5, 15)
+                damage = _randint(5, 15)
                 game.player.ship.hull -= damage
-                print(f"\nMicro-meteorites damage your hull! -{damage} hull points.")
+                _emit("", f"Micro-meteorites damage your hull! -{damage} hull points.")
                 
         return True
 
@@ -37,22 +50,22 @@ class DebrisFieldEvent(Event):
 class DistressSignalEvent(Event):
     """Receive a mysterious distress signal."""
     
+    __slots__ = ()
+    
     def _execute(self, game: 'Game', context: dict) -> bool:
         """Execute distress signal event."""
-        print('\n"...anyone... please... failing..."')
-        choice = input("Investigate the signal? (y/n) > ").lower()
-        
-        if choice == 'y':
-            if random.random() < 0.6:
+        _emit("", '"...anyone... please... failing..."')
+        if _yes("Investigate the signal? (y/n) > "):
+            if _rand() < 0.6:
                 # Genuine distress
-                print("\nYou find a damaged escape pod!")
-                print("The grateful survivor offers a reward.")
+                _emit("", "You find a damaged escape pod!",
+                      "The grateful survivor offers a reward.")
                 game.player.credits += 750
                 game.player.add_reputation("Independent", 5)
                 game.player.gain_skill("leadership", 2)
             else:
                 # Pirate trap!
-                print("\nIt's a trap! Pirates attack!")
+                _emit("", "It's a trap! Pirates attack!")
                 # Trigger a pirate encounter
                 from .travel_events import PirateEncounterEvent
                 pirate_event = PirateEncounterEvent(EventConfig(
@@ -71,31 +84,31 @@ class DistressSignalEvent(Event):
 class CosmicAnomalyEvent(Event):
     """Encounter a strange cosmic anomaly."""
     
+    __slots__ = ()
+    
     def _execute(self, game: 'Game', context: dict) -> bool:
         """Execute cosmic anomaly event."""
-        print("\nThe anomaly seems to be affecting local spacetime.")
-        choice = input("Investigate closer? (y/n) > ").lower()
-        
-        if choice == 'y':
-            outcome = random.random()
+        _emit("", "The anomaly seems to be affecting local spacetime.")
+        if _yes("Investigate closer? (y/n) > "):
+            outcome = _rand()
             if outcome < 0.3:
                 # Positive effect
-                print("\nThe anomaly enhances your ship's systems!")
                 game.player.ship.fuel = min(game.player.ship.max_fuel, 
                                            game.player.ship.fuel + 10)
-                print("Fuel systems recharged: +10 fuel")
+                _emit("", "The anomaly enhances your ship's systems!",
+                      "Fuel systems recharged: +10 fuel")
                 game.player.ship.gain_experience("exploration", 5)
                 
             elif outcome < 0.6:
                 # Negative effect
-                print("\nThe anomaly disrupts your navigation systems!")
-                print("You're thrown off course and lose time.")
+                _emit("", "The anomaly disrupts your navigation systems!",
+                      "You're thrown off course and lose time.")
                 game.current_day += 1
                 game._handle_daily_costs()
                 
             else:
                 # Discovery
-                print("\nYou collect valuable scientific data!")
+                _emit("", "You collect valuable scientific data!")
                 game.player.credits += 300
                 game.player.gain_skill("piloting", 3)
                 game.player.ship.gain_experience("exploration", 3)
@@ -106,21 +119,23 @@ class CosmicAnomalyEvent(Event):
 class RogueAsteroidEvent(Event):
     """Encounter a massive rogue asteroid."""
     
+    __slots__ = ()
+    
     def _execute(self, game: 'Game', context: dict) -> bool:
         """Execute rogue asteroid event."""
-        print("\nYour collision alarm is blaring!")
+        _emit("", "Your collision alarm is blaring!")
         
         dodge_chance = 0.5 + game.player.get_skill_bonus("piloting")
         if game.player.ship.specialization == "exploration":
             dodge_chance += 0.2
             
-        if random.random() < dodge_chance:
-            print("\nSkillful piloting helps you avoid the asteroid!")
+        if _rand() < dodge_chance:
+            _emit("", "Skillful piloting helps you avoid the asteroid!")
             game.player.gain_skill("piloting", 2)
         else:
-            damage = random.randint(10, 25)
+            damage = _randint(10, 25)
             game.player.ship.hull -= damage
-            print(f"\nThe asteroid clips your ship! Hull damage: -{damage}")
+            _emit("", f"The asteroid clips your ship! Hull damage: -{damage}")
             
         return True
 
@@ -128,56 +143,58 @@ class RogueAsteroidEvent(Event):
 class AncientArtifactEvent(Event):
     """Discover an ancient alien artifact."""
     
+    __slots__ = ()
+    
     def _execute(self, game: 'Game', context: dict) -> bool:
         """Execute ancient artifact discovery."""
-        print("\nYour scanners detect an artificial object of unknown origin.")
-        print("It appears to be an ancient artifact!")
-        
-        print("\nOptions:")
-        print("1. Retrieve and study it")
-        print("2. Scan from a distance")
-        print("3. Mark location and leave")
+        _emit("", "Your scanners detect an artificial object of unknown origin.",
+              "It appears to be an ancient artifact!",
+              "", "Options:",
+              "1. Retrieve and study it",
+              "2. Scan from a distance",
+              "3. Mark location and leave")
         
-        choice = input("\nYour choice (1-3): ").strip()
+        choice = input("\nYour choice (1-3): ").strip()[:1]
         
         if choice == "1":
             # Retrieve artifact
-            print("\nYou carefully retrieve the artifact...")
-            
-            outcome = random.random()
+            outcome = _rand()
             if outcome < 0.4:
                 # Valuable artifact
-                value = random.randint(2000, 5000)
+                value = _randint(2000, 5000)
                 game.player.credits += value
-                print(f"The artifact is incredibly valuable! You sell it for {value} credits.")
+                _emit("", "You carefully retrieve the artifact...",
+                      f"The artifact is incredibly valuable! You sell it for {value} credits.")
                 game.player.ship.gain_experience("exploration", 10)
                 
             elif outcome < 0.7:
                 # Knowledge artifact
-                print("The artifact contains ancient knowledge!")
-                print("Studying it improves your skills.")
+                _emit("", "You carefully retrieve the artifact...",
+                      "The artifact contains ancient knowledge!",
+                      "Studying it improves your skills.")
                 game.player.gain_skill("piloting", 5)
                 game.player.gain_skill("mechanics", 5)
                 game.player.gain_skill("leadership", 3)
                 
             else:
                 # Dangerous artifact
-                print("The artifact emits a strange energy pulse!")
-                print("Your ship's systems are damaged!")
+                _emit("", "You carefully retrieve the artifact...",
+                      "The artifact emits a strange energy pulse!",
+                      "Your ship's systems are damaged!")
                 game.player.ship.hull -= 20
                 if hasattr(game.player.ship, 'shields'):
                     game.player.ship.shields = 0
                     
         elif choice == "2":
             # Scan only
-            print("\nYour scans reveal fascinating data about the artifact.")
+            _emit("", "Your scans reveal fascinating data about the artifact.")
             game.player.credits += 500
             game.player.ship.gain_experience("exploration", 5)
             
         else:
             # Mark and leave
-            print("\nYou mark the location for future exploration.")
-            print("Perhaps someone else will brave the risks.")
+            _emit("", "You mark the location for future exploration.",
+                  "Perhaps someone else will brave the risks.")
             
         return True
 
@@ -185,52 +202,52 @@ class AncientArtifactEvent(Event):
 class SpaceWhaleEvent(Event):
     """Encounter mysterious space creatures."""
     
+    __slots__ = ()
+    
     def _execute(self, game: 'Game', context: dict) -> bool:
         """Execute space whale encounter."""
-        print("\nYour sensors detect massive life forms in the void!")
-        print("They appear to be some kind of space-dwelling creatures.")
-        
-        print("\nThe creatures are:")
-        creature_type = random.choice([
+        creature_type = _choice([
             "majestic and peaceful",
             "curious about your ship",
             "feeding on cosmic radiation",
             "migrating through the system"
         ])
-        print(f"- {creature_type}")
-        
-        print("\nOptions:")
-        print("1. Observe and document")
-        print("2. Attempt communication")
-        print("3. Leave quickly")
+        _emit("", "Your sensors detect massive life forms in the void!",
+              "They appear to be some kind of space-dwelling creatures.",
+              "", "The creatures are:",
+              f"- {creature_type}",
+              "", "Options:",
+              "1. Observe and document",
+              "2. Attempt communication",
+              "3. Leave quickly")
         
-        choice = input("\nYour choice (1-3): ").strip()
+        choice = input("\nYour choice (1-3): ").strip()[:1]
         
         if choice == "1":
             # Observe
-            print("\nYou spend time observing these magnificent creatures.")
-            print("The scientific data you collect is valuable!")
+            _emit("", "You spend time observing these magnificent creatures.",
+                  "The scientific data you collect is valuable!")
             game.player.credits += 400
             game.player.ship.gain_experience("exploration", 7)
             game.player.gain_skill("piloting", 2)
             
         elif choice == "2":
             # Communicate
-            print("\nYou broadcast various signals toward the creatures...")
-            
-            if random.random() < 0.3:
-                print("They respond! The creatures seem intelligent!")
-                print("They share cosmic knowledge with you.")
+            if _rand() < 0.3:
+                _emit("", "You broadcast various signals toward the creatures...",
+                      "They respond! The creatures seem intelligent!",
+                      "They share cosmic knowledge with you.")
                 game.player.gain_skill("piloting", 10)
                 game.player.ship.gain_experience("exploration", 15)
                 
                 # Chance for special reward
-                if random.random() < 0.5:
-                    print("\nThe creatures guide you to a resource cache!")
+                if _rand() < 0.5:
+                    _emit("", "The creatures guide you to a resource cache!")
                     game.player.credits += 1000
             else:
-                print("The creatures ignore your attempts at communication.")
-                print("Still, you learn from the experience.")
+                _emit("", "You broadcast various signals toward the creatures...",
+                      "The creatures ignore your attempts at communication.",
+                      "Still, you learn from the experience.")
                 game.player.ship.gain_experience("exploration", 3)
                 
         return True
@@ -239,23 +256,24 @@ class SpaceWhaleEvent(Event):
 class WormholeEvent(Event):
     """Discover an unstable wormhole."""
     
+    __slots__ = ()
+    
     def _execute(self, game: 'Game', context: dict) -> bool:
         """Execute wormhole discovery."""
-        print("\nYour instruments detect a spatial anomaly - it's a wormhole!")
-        print("It appears unstable and may not last long.")
-        
-        print("\nOptions:")
-        print("1. Enter the wormhole")
-        print("2. Study it from a safe distance")
-        print("3. Leave immediately")
+        _emit("", "Your instruments detect a spatial anomaly - it's a wormhole!",
+              "It appears unstable and may not last long.",
+              "", "Options:",
+              "1. Enter the wormhole",
+              "2. Study it from a safe distance",
+              "3. Leave immediately")
         
-        choice = input("\nYour choice (1-3): ").strip()
+        choice = input("\nYour choice (1-3): ").strip()[:1]
         
         if choice == "1":
             # Enter wormhole
-            print("\nYou brave the unknown and enter the wormhole...")
+            _emit("", "You brave the unknown and enter the wormhole...")
             
-            outcome = random.random()
+            outcome = _rand()
             if outcome < 0.4:
                 # Random system jump
                 systems = list(game.galaxy.systems.keys())
@@ -263,21 +281,21 @@ class WormholeEvent(Event):
                 destinations = [s for s in systems if s != current]
                 
                 if destinations:
-                    destination = random.choice(destinations)
+                    destination = _choice(destinations)
                     game.player.location = game.galaxy.systems[destination]
-                    print(f"\nThe wormhole deposits you in {destination}!")
-                    print("Your fuel is completely drained from the journey.")
+                    _emit("", f"The wormhole deposits you in {destination}!",
+                          "Your fuel is completely drained from the journey.")
                     game.player.ship.fuel = 0
                 else:
-                    print("\nThe wormhole collapses! You barely escape!")
+                    _emit("", "The wormhole collapses! You barely escape!")
                     game.player.ship.hull -= 30
                     
             elif outcome < 0.7:
                 # Time dilation
-                print("\nTime flows strangely in the wormhole...")
-                days = random.randint(5, 15)
+                days = _randint(5, 15)
                 game.current_day += days
-                print(f"You emerge {days} days later!")
+                _emit("", "Time flows strangely in the wormhole...",
+                      f"You emerge {days} days later!")
                 
                 # Process daily costs
                 for _ in range(days):
@@ -285,13 +303,13 @@ class WormholeEvent(Event):
                     
             else:
                 # Valuable discovery
-                print("\nThe wormhole leads to a pocket of space rich in resources!")
+                _emit("", "The wormhole leads to a pocket of space rich in resources!")
                 game.player.credits += 2000
                 game.player.ship.gain_experience("exploration", 20)
                 
         elif choice == "2":
             # Study only
-            print("\nYou collect valuable data about wormhole mechanics.")
+            _emit("", "You collect valuable data about wormhole mechanics.")
             game.player.credits += 300
             game.player.gain_skill("piloting", 3)
             game.player.ship.gain_experience("exploration", 5)
@@ -5,9 +5,12 @@ Events that can occur while traveling between star systems.
 """
 
 import random
-from typing import TYPE_CHECKING
+import sys
+from bisect import bisect_right
+from typing import Optional, TYPE_CHECKING
 from ..event_system import Event, EventConfig, EventType, EventTrigger, EventRegistry
-from ..game_data import ILLEGAL_GOODS
+from ..classes import Ship
+from ..game_data import GOODS, ILLEGAL_GOODS
 from ..constants import (
     PIRATE_FLEE_BASE_CHANCE, PIRATE_FLEE_EXPLORATION_BONUS, 
     PIRATE_NEGOTIATE_BASE_CHANCE, PIRATE_NEGOTIATE_CREW_BONUS,
@@ -20,154 +23,248 @@ if TYPE_CHECKING:
     from ..main import Game
 
 
+def _ask(prompt: str, valid: frozenset) -> str:
+    """Prompt until the player gives one of the valid (lowercased) answers."""
+    while True:
+        answer = input(prompt).strip().lower()
+        if answer in valid:
+            return answer
+        print("Please choose one of the listed options.")
+
+
+def _ask_yes_no(prompt: str) -> bool:
+    """Prompt until the answer starts with y or n; True for y.
+    
+    Only the first letter counts, as with the exploration prompts, so
+    'yes' and 'no' work too.
+    """
+    while True:
+        answer = input(prompt).strip().lower()[:1]
+        if answer == "y" or answer == "n":
+            return answer == "y"
+        print("Please choose one of the listed options.")
+
+
+# Lookup tables built once at import time
+_GOODS_KEYS = tuple(GOODS)
+_ILLEGAL_SET = frozenset(ILLEGAL_GOODS)
+_PIRATE_NAMES = ("Blackbeard's Revenge", "Crimson Scourge", "Shadow Raider", "Void Reaper")
+_HUNTER_NAMES = ("Steel Wolf", "Black Widow", "The Reaper", "Crimson Blade", "Shadow Strike")
+_MENU_CHOICES = frozenset({"1", "2", "3"})
+_BOUNTY_CHOICES = frozenset({"1", "2", "3", "4"})
+_PIRATE_DAMAGE_RANGE = range(10, 21)
+_DAMAGE_BATCH_SIZE = 32
+
+# Static option menus, each written in a single print
+_PIRATE_MENU = """Options:
+1. Fight
+2. Flee
+3. Negotiate"""
+_BOUNTY_MENU = """
+Options:
+1. Surrender peacefully (pay {bounty} credits fine, clear wanted status)
+2. Try to bribe the bounty hunter ({bribe} credits)
+3. Attempt to flee
+4. Fight!"""
+_DERELICT_MENU = """
+Options:
+1. Board and search for salvage
+2. Scan from a safe distance
+3. Ignore it and continue"""
+_ASTEROID_MENU = """Your navigation computer plots several routes:
+
+1. Safe route (costs 5 extra fuel)
+2. Direct route (risky but fast)
+3. Scenic route (chance to find minerals)"""
+
+# Reputation tiers for customs scrutiny: below -25, below 0, otherwise.
+# Each tier maps to a (scan multiplier, scan chance cap) pair.
+_CUSTOMS_REP_THRESHOLDS = (-25, 0)
+_CUSTOMS_REP_TIERS = (
+    (CUSTOMS_BAD_REP_MULTIPLIER, 0.8),
+    (CUSTOMS_NEGATIVE_REP_MULTIPLIER, 0.6),
+    (1.0, 1.0),
+)
+
+
 class PirateEncounterEvent(Event):
     """Random pirate encounter during travel."""
     
+    __slots__ = ()
+    
     def _execute(self, game: 'Game', context: dict) -> bool:
         """Execute pirate encounter."""
-        pirate_names = ["Blackbeard's Revenge", "Crimson Scourge", "Shadow Raider", "Void Reaper"]
-        pirate_name = random.choice(pirate_names)
+        pirate_name = random.choice(_PIRATE_NAMES)
         
         print(f"You've been ambushed by the pirate ship '{pirate_name}'!")
-        print("Options:")
-        print("1. Fight")
-        print("2. Flee")
-        print("3. Negotiate")
+        print(_PIRATE_MENU)
         
-        choice = input("\nYour choice (1-3): ").strip()
+        choice = _ask("\nYour choice (1-3): ", _MENU_CHOICES)
         
-        if choice == "1":
-            # Combat
-            from ..classes import Ship
-            
-            # Create pirate ship
-            pirate_ship = Ship("fighter")
-            pirate_ship.name = pirate_name
-            pirate_ship.hull = random.randint(30, 60)
-            # Set base hull to match current hull for pirate
-            pirate_ship.ship_class_data["base_hull"] = pirate_ship.hull
-            
-            # Simple combat
-            print(f"\n--- COMBAT: {game.player.ship.name} vs {pirate_ship.name} ---")
-            
-            while pirate_ship.hull > 0 and game.player.ship.hull > 0:
-                # Player attacks
-                damage = game.player.ship.get_weapon_damage(game.player)
-                pirate_ship.hull -= damage
-                print(f"You deal {damage} damage! Pirate hull: {max(0, pirate_ship.hull)}")
-                
-                if pirate_ship.hull <= 0:
-                    break
-                    
-                # Pirate attacks
-                pirate_damage = random.randint(10, 20)
-                shield_strength = game.player.ship.get_shield_strength()
-                shield_absorbed = min(pirate_damage, shield_strength)
-                hull_damage = pirate_damage - shield_absorbed
-                
-                if shield_absorbed > 0:
-                    # Reduce shield strength (this is handled by the shield system)
-                    print(f"Shields absorb {shield_absorbed} damage!")
-                    
-                if hull_damage > 0:
-                    game.player.ship.hull -= hull_damage
-                    print(f"Hull takes {hull_damage} damage! Your hull: {game.player.ship.hull}")
+        handler = self._CHOICES.get(choice)
+        if handler is not None:
+            handler(self, game, pirate_name)
+        return True
+    
+    def _fight(self, game: 'Game', pirate_name: str) -> None:
+        """Fight the pirate ship to the finish."""
+        # Create pirate ship
+        pirate_ship = Ship("fighter")
+        pirate_ship.name = pirate_name
+        pirate_ship.hull = random.randint(30, 60)
+        # Set base hull to match current hull for pirate
+        pirate_ship.ship_class_data["base_hull"] = pirate_ship.hull
+        
+        # Simple combat
+        print(f"\n--- COMBAT: {game.player.ship.name} vs {pirate_ship.name} ---")
+        
+        # Pre-roll pirate damage in batches rather than one randint per turn
+        damage_rolls = []
+        turn_log = []
+        emit = turn_log.append
+        player = game.player
+        player_ship = player.ship
+        # Crew and modules can't change mid-fight, so snapshot combat stats once
+        damage = player_ship.get_weapon_damage(player)
+        shield_strength = player_ship.get_shield_strength()
+        while pirate_ship.hull > 0 and player_ship.hull > 0:
+            # Player attacks
+            pirate_ship.hull -= damage
+            emit(f"You deal {damage} damage! Pirate hull: {max(0, pirate_ship.hull)}")
             
             if pirate_ship.hull <= 0:
-                print("\nVictory! The pirate ship is destroyed!")
-                loot = random.randint(200, 500)
-                game.player.credits += loot
-                print(f"You salvage {loot} credits from the wreckage.")
-                game.player.ship.gain_experience("combat", 5)
-                game.player.give_crew_experience("Weapons Officer", 2)
-            else:
-                print("\nYour ship has been destroyed!")
-                game.game_over = True
-                
-        elif choice == "2":
-            # Flee
-            flee_chance = PIRATE_FLEE_BASE_CHANCE + game.player.get_skill_bonus("piloting")
-            if game.player.ship.specialization == "exploration":
-                flee_chance += PIRATE_FLEE_EXPLORATION_BONUS
-                
-            if random.random() < flee_chance:
-                print("\nYou manage to escape!")
-                game.player.gain_skill("piloting", 2)
-            else:
-                print("\nYou fail to escape!")
-                damage = random.randint(15, 30)
-                game.player.ship.hull -= damage
-                print(f"The pirates deal {damage} damage before you get away!")
-                
-        elif choice == "3":
-            # Negotiate
-            negotiate_chance = PIRATE_NEGOTIATE_BASE_CHANCE + game.player.get_skill_bonus("negotiation")
-            if game.player.get_crew_bonus("Negotiator") > 0:
-                negotiate_chance += PIRATE_NEGOTIATE_CREW_BONUS
+                break
                 
-            if random.random() < negotiate_chance:
-                tribute = min(game.player.credits // 3, 1000)
-                print(f"\nThe pirates accept {tribute} credits as tribute.")
-                game.player.credits -= tribute
-                game.player.gain_skill("negotiation", 3)
-            else:
-                print("\nNegotiations fail! The pirates attack!")
-                return self._execute(game, context)  # Force combat
+            # Pirate attacks
+            if not damage_rolls:
+                damage_rolls = random.choices(_PIRATE_DAMAGE_RANGE, k=_DAMAGE_BATCH_SIZE)
+            pirate_damage = damage_rolls.pop()
+            shield_absorbed = min(pirate_damage, shield_strength)
+            hull_damage = pirate_damage - shield_absorbed
+            
+            if shield_absorbed > 0:
+                # Reduce shield strength (this is handled by the shield system)
+                emit(f"Shields absorb {shield_absorbed} damage!")
                 
-        return True
+            if hull_damage > 0:
+                player_ship.hull -= hull_damage
+                emit(f"Hull takes {hull_damage} damage! Your hull: {player_ship.hull}")
+            
+            # Flush the whole turn in one write
+            sys.stdout.write("\n".join(turn_log) + "\n")
+            turn_log.clear()
+        
+        if turn_log:
+            sys.stdout.write("\n".join(turn_log) + "\n")
+        
+        if pirate_ship.hull <= 0:
+            print("\nVictory! The pirate ship is destroyed!")
+            loot = random.randint(200, 500)
+            print(f"You salvage {loot} credits from the wreckage.")
+            game.player.apply_reward(credits=loot, ship_xp=("combat", 5),
+                                     crew_xp=("Weapons Officer", 2))
+        else:
+            print("\nYour ship has been destroyed!")
+            game.game_over = True
+    
+    def _flee(self, game: 'Game', pirate_name: str) -> None:
+        """Try to outrun the pirates."""
+        flee_chance = PIRATE_FLEE_BASE_CHANCE + game.player.get_skill_bonus("piloting")
+        if game.player.ship.specialization == "exploration":
+            flee_chance += PIRATE_FLEE_EXPLORATION_BONUS
+            
+        if random.random() < flee_chance:
+            print("\nYou manage to escape!")
+            game.player.gain_skill("piloting", 2)
+        else:
+            print("\nYou fail to escape!")
+            damage = random.randint(15, 30)
+            game.player.ship.hull -= damage
+            print(f"The pirates deal {damage} damage before you get away!")
+    
+    def _negotiate(self, game: 'Game', pirate_name: str) -> None:
+        """Offer tribute; failed negotiations force combat."""
+        negotiate_chance = PIRATE_NEGOTIATE_BASE_CHANCE + game.player.get_skill_bonus("negotiation")
+        if game.player.get_crew_bonus("Negotiator") > 0:
+            negotiate_chance += PIRATE_NEGOTIATE_CREW_BONUS
+            
+        if random.random() < negotiate_chance:
+            tribute = min(game.player.credits // 3, 1000)
+            print(f"\nThe pirates accept {tribute} credits as tribute.")
+            game.player.credits -= tribute
+            game.player.gain_skill("negotiation", 3)
+        else:
+            print("\nNegotiations fail! The pirates attack!")
+            self._fight(game, pirate_name)
+    
+    _CHOICES = {"1": _fight, "2": _flee, "3": _negotiate}
 
 
 class CustomsScanEvent(Event):
     """Customs inspection event."""
     
+    __slots__ = ()
+    
     def _execute(self, game: 'Game', context: dict) -> bool:
         """Execute customs scan."""
+        # Nothing to find means nothing to roll for
+        if _ILLEGAL_SET.isdisjoint(game.player.ship.cargo_hold):
+            print("The patrol ship passes by without incident.")
+            return True
+        
         faction = game.player.location.faction
+        benefits = game.player.get_rank_benefits(faction)
+        
+        if random.random() > self._scan_chance(game, faction, benefits):
+            print("The patrol ship passes by without incident.")
+            return True
+        
+        print(f"You are hailed by a {faction} patrol for a routine customs scan.")
+        
+        illegal_cargo, total_fine = self._find_contraband(game)
+        print("\n--- CONTRABAND DETECTED! ---")
         
+        total_fine = self._offer_bribe(game, faction, benefits, total_fine)
+        if total_fine is not None:
+            self._penalize(game, faction, illegal_cargo, total_fine)
+            
+        return True
+    
+    def _scan_chance(self, game: 'Game', faction: str, benefits: dict) -> float:
+        """Chance of being scanned given rank benefits and reputation."""
         reputation = game.player.reputation.get(faction, 0)
         scan_chance = CUSTOMS_SCAN_BASE_CHANCE
         
         # Check rank benefits for reduced scrutiny
-        benefits = game.player.get_rank_benefits(faction)
         if "reduced_customs_scrutiny" in benefits:
             scan_chance *= benefits["reduced_customs_scrutiny"]
         elif "diplomatic_immunity" in benefits:
             scan_chance = CUSTOMS_DIPLOMATIC_IMMUNITY
         
-        if reputation < -25:
-            scan_chance = min(0.8, scan_chance * CUSTOMS_BAD_REP_MULTIPLIER)
-        elif reputation < 0:
-            scan_chance = min(0.6, scan_chance * CUSTOMS_NEGATIVE_REP_MULTIPLIER)
-            
-        if random.random() > scan_chance:
-            print("The patrol ship passes by without incident.")
-            return True
-        
-        print(f"You are hailed by a {faction} patrol for a routine customs scan.")
-        
+        multiplier, cap = _CUSTOMS_REP_TIERS[bisect_right(_CUSTOMS_REP_THRESHOLDS, reputation)]
+        return min(cap, scan_chance * multiplier)
+    
+    def _find_contraband(self, game: 'Game') -> tuple:
+        """Collect (good, quantity) for illegal cargo and the total fine."""
         illegal_cargo = []
+        total_fine = 0
         for good, quantity in game.player.ship.cargo_hold.items():
-            if good in ILLEGAL_GOODS:
+            if good in _ILLEGAL_SET:
+                total_fine += ILLEGAL_GOODS[good]["base_price"] * quantity * 2
                 illegal_cargo.append((good, quantity))
+        return illegal_cargo, total_fine
+    
+    def _offer_bribe(self, game: 'Game', faction: str, benefits: dict,
+                     total_fine: int) -> Optional[int]:
+        """Let the player try a bribe.
         
-        if not illegal_cargo:
-            print("The scan reveals nothing illegal. They let you pass.")
-            return True
-            
-        print("\n--- CONTRABAND DETECTED! ---")
-        
-        # Calculate fines
-        total_fine = 0
-        for good, quantity in illegal_cargo:
-            base_price = ILLEGAL_GOODS[good]["base_price"]
-            fine = base_price * quantity * 2
-            total_fine += fine
-            
+        Returns:
+            The fine still owed, or None if the bribe was accepted
+        """
         bribe_amount = int(total_fine * CUSTOMS_BRIBE_PERCENTAGE)
         
         if game.player.credits >= bribe_amount:
-            choice = input(f"Offer a {bribe_amount} credit 'donation' to avoid trouble? (y/n) > ").lower()
-            if choice == 'y':
+            if _ask_yes_no(f"Offer a {bribe_amount} credit 'donation' to avoid trouble? (y/n) > "):
                 bribe_success_chance = CUSTOMS_BRIBE_SUCCESS_CHANCE
                 if "intimidation_bonus" in benefits:
                     bribe_success_chance = min(0.95, CUSTOMS_BRIBE_SUCCESS_CHANCE + (benefits["intimidation_bonus"] - 1) * 0.1)
@@ -177,38 +274,39 @@ class CustomsScanEvent(Event):
                     print("The customs officer pockets the credits and looks the other way.")
                     if "intimidation_bonus" in benefits:
                         print("Your reputation precedes you - the officer seems eager to avoid trouble.")
-                    return True
+                    return None
                 else:
                     print("The customs officer refuses your bribe and calls for backup!")
                     total_fine *= 2
                     game.player.add_reputation(faction, -10)
-        
-        # Confiscate goods and apply fines
+        return total_fine
+    
+    def _penalize(self, game: 'Game', faction: str, illegal_cargo: list,
+                  total_fine: int) -> None:
+        """Confiscate contraband and apply fines, reputation loss and wanted level."""
         for good, quantity in illegal_cargo:
             print(f"Your {quantity} units of {good} have been confiscated!")
-            game.player.ship.remove_cargo(good, quantity)
             
         reputation_loss = 25 * len(illegal_cargo)
         print(f"You have been fined {total_fine} credits and your reputation with {faction} has been damaged.")
-        game.player.credits -= total_fine
-        game.player.add_reputation(faction, -reputation_loss)
-        
-        # Increase wanted level
-        if len(illegal_cargo) >= 3:
-            game.player.increase_wanted_level(faction, 2)
-        else:
-            game.player.increase_wanted_level(faction, 1)
+        game.player.apply_penalty(
+            fine=total_fine,
+            faction=faction,
+            reputation=-reputation_loss,
+            wanted=2 if len(illegal_cargo) >= 3 else 1,
+            confiscate=illegal_cargo
+        )
         
         if game.player.credits < 0:
             print("You couldn't afford the fine and have been thrown in jail. Your journey ends here.")
             game.game_over = True
-            
-        return True
 
 
 class BountyHunterEvent(Event):
     """Bounty hunter encounter for wanted players."""
     
+    __slots__ = ()
+    
     def _execute(self, game: 'Game', context: dict) -> bool:
         """Execute bounty hunter encounter."""
         wanted_level = game.player.get_total_wanted_level()
@@ -219,84 +317,85 @@ class BountyHunterEvent(Event):
         else:
             faction = "Independent"
         
-        hunter_names = ["Steel Wolf", "Black Widow", "The Reaper", "Crimson Blade", "Shadow Strike"]
-        hunter_name = random.choice(hunter_names)
+        hunter_name = random.choice(_HUNTER_NAMES)
         
         print(f"A bounty hunter ship hails you! It's {hunter_name}, working for the {faction}.")
         print(f'"There\'s a bounty on your head, Captain. Come quietly or face the consequences!"')
         
         bounty = wanted_level * 2000
         
-        print(f"\nOptions:")
-        print(f"1. Surrender peacefully (pay {bounty} credits fine, clear wanted status)")
-        print(f"2. Try to bribe the bounty hunter ({bounty // 2} credits)")
-        print(f"3. Attempt to flee")
-        print(f"4. Fight!")
+        print(_BOUNTY_MENU.format(bounty=bounty, bribe=bounty // 2))
         
-        choice = input("\nYour choice (1-4): ").strip()
+        choice = _ask("\nYour choice (1-4): ", _BOUNTY_CHOICES)
         
-        if choice == "1":
-            # Surrender
-            if game.player.credits >= bounty:
-                game.player.credits -= bounty
-                print(f"\nYou transfer {bounty} credits and surrender to the authorities.")
-                print("After processing, your wanted status has been cleared.")
-                
-                if faction != "Independent":
-                    game.player.decrease_wanted_level(faction, game.player.wanted_by.get(faction, 0))
-                else:
-                    game.player.wanted_level = 0
-                    
-                if faction != "Independent":
-                    game.player.add_reputation(faction, -5)
-            else:
-                print("\nYou don't have enough credits to pay the bounty!")
-                print("The bounty hunter takes what you have and your ship.")
-                game.game_over = True
-                
-        elif choice == "2":
-            # Bribe
-            bribe_amount = bounty // 2
-            if game.player.credits >= bribe_amount:
-                game.player.credits -= bribe_amount
-                
-                success_chance = 0.6 - (wanted_level * 0.1)
-                success_chance += game.player.get_skill_bonus("negotiation")
-                
-                if random.random() < success_chance:
-                    print(f"\nThe bounty hunter accepts your {bribe_amount} credit bribe.")
-                    print('"I never saw you, Captain. But watch your back - others are looking."')
-                    
-                    if faction != "Independent":
-                        game.player.decrease_wanted_level(faction, 1)
-                    else:
-                        game.player.decrease_wanted_level(None, 1)
-                else:
-                    print('\nThe bounty hunter refuses your bribe!')
-                    print('"Nice try, but I have a reputation to maintain."')
-                    return self._bounty_hunter_combat(game, hunter_name, wanted_level)
-            else:
-                print("\nYou don't have enough credits for a bribe!")
-                return self._bounty_hunter_combat(game, hunter_name, wanted_level)
-                
-        elif choice == "3":
-            # Flee
-            flee_chance = 0.4 + game.player.get_skill_bonus("piloting")
-            flee_chance -= wanted_level * 0.05
+        return self._CHOICES[choice](self, game, faction, hunter_name, wanted_level, bounty)
+    
+    def _surrender(self, game: 'Game', faction: str, hunter_name: str,
+                   wanted_level: int, bounty: int) -> bool:
+        """Pay the bounty and clear wanted status."""
+        if game.player.credits >= bounty:
+            game.player.credits -= bounty
+            print(f"\nYou transfer {bounty} credits and surrender to the authorities.")
+            print("After processing, your wanted status has been cleared.")
             
-            if random.random() < flee_chance:
-                print("\nYou manage to escape the bounty hunter!")
-                game.player.gain_skill("piloting", 3)
+            if faction != "Independent":
+                game.player.decrease_wanted_level(faction, game.player.wanted_by.get(faction, 0))
             else:
-                print("\nThe bounty hunter's ship is too fast! You can't escape!")
-                return self._bounty_hunter_combat(game, hunter_name, wanted_level)
+                game.player.wanted_level = 0
                 
+            if faction != "Independent":
+                game.player.add_reputation(faction, -5)
         else:
-            # Fight
-            return self._bounty_hunter_combat(game, hunter_name, wanted_level)
-            
+            print("\nYou don't have enough credits to pay the bounty!")
+            print("The bounty hunter takes what you have and your ship.")
+            game.game_over = True
         return True
     
+    def _bribe(self, game: 'Game', faction: str, hunter_name: str,
+               wanted_level: int, bounty: int) -> bool:
+        """Try to buy off the hunter; failure leads to combat."""
+        bribe_amount = bounty // 2
+        if game.player.credits >= bribe_amount:
+            game.player.credits -= bribe_amount
+            
+            success_chance = 0.6 - (wanted_level * 0.1)
+            success_chance += game.player.get_skill_bonus("negotiation")
+            
+            if random.random() < success_chance:
+                print(f"\nThe bounty hunter accepts your {bribe_amount} credit bribe.")
+                print('"I never saw you, Captain. But watch your back - others are looking."')
+                
+                if faction != "Independent":
+                    game.player.decrease_wanted_level(faction, 1)
+                else:
+                    game.player.decrease_wanted_level(None, 1)
+                return True
+            print('\nThe bounty hunter refuses your bribe!')
+            print('"Nice try, but I have a reputation to maintain."')
+        else:
+            print("\nYou don't have enough credits for a bribe!")
+        return self._bounty_hunter_combat(game, hunter_name, wanted_level)
+    
+    def _flee(self, game: 'Game', faction: str, hunter_name: str,
+              wanted_level: int, bounty: int) -> bool:
+        """Try to outrun the hunter; failure leads to combat."""
+        flee_chance = 0.4 + game.player.get_skill_bonus("piloting")
+        flee_chance -= wanted_level * 0.05
+        
+        if random.random() < flee_chance:
+            print("\nYou manage to escape the bounty hunter!")
+            game.player.gain_skill("piloting", 3)
+            return True
+        print("\nThe bounty hunter's ship is too fast! You can't escape!")
+        return self._bounty_hunter_combat(game, hunter_name, wanted_level)
+    
+    def _fight(self, game: 'Game', faction: str, hunter_name: str,
+               wanted_level: int, bounty: int) -> bool:
+        """Fight the hunter."""
+        return self._bounty_hunter_combat(game, hunter_name, wanted_level)
+    
+    _CHOICES = {"1": _surrender, "2": _bribe, "3": _flee, "4": _fight}
+    
     def _bounty_hunter_combat(self, game: 'Game', hunter_name: str, wanted_level: int) -> bool:
         """Handle combat with bounty hunter."""
         print(f"\n--- COMBAT: {game.player.ship.name} vs {hunter_name} ---")
@@ -305,26 +404,38 @@ class BountyHunterEvent(Event):
         hunter_hull = 40 + (wanted_level * 10)
         hunter_damage = 15 + (wanted_level * 3)
         
-        while hunter_hull > 0 and game.player.ship.hull > 0:
+        turn_log = []
+        emit = turn_log.append
+        player = game.player
+        player_ship = player.ship
+        # Crew and modules can't change mid-fight, so snapshot weapon damage once
+        damage = player_ship.get_weapon_damage(player)
+        while hunter_hull > 0 and player_ship.hull > 0:
             # Player attacks
-            damage = game.player.ship.get_weapon_damage(game.player)
             hunter_hull -= damage
-            print(f"You deal {damage} damage! Hunter hull: {max(0, hunter_hull)}")
+            emit(f"You deal {damage} damage! Hunter hull: {max(0, hunter_hull)}")
             
             if hunter_hull <= 0:
                 break
                 
             # Hunter attacks
-            shield_absorbed = min(hunter_damage, game.player.ship.shields)
+            shield_absorbed = min(hunter_damage, player_ship.shield)
             hull_damage = hunter_damage - shield_absorbed
             
             if shield_absorbed > 0:
-                game.player.ship.shields -= shield_absorbed
-                print(f"Shields absorb {shield_absorbed} damage!")
+                player_ship.shield -= shield_absorbed
+                emit(f"Shields absorb {shield_absorbed} damage!")
                 
             if hull_damage > 0:
-                game.player.ship.hull -= hull_damage
-                print(f"Hull takes {hull_damage} damage! Your hull: {game.player.ship.hull}")
+                player_ship.hull -= hull_damage
+                emit(f"Hull takes {hull_damage} damage! Your hull: {player_ship.hull}")
+            
+            # Flush the whole turn in one write
+            sys.stdout.write("\n".join(turn_log) + "\n")
+            turn_log.clear()
+        
+        if turn_log:
+            sys.stdout.write("\n".join(turn_log) + "\n")
         
         if hunter_hull <= 0:
             print(f"\nYou've defeated {hunter_name}!")
@@ -341,121 +452,153 @@ class BountyHunterEvent(Event):
 class DerelictShipEvent(Event):
     """Find a derelict ship while traveling."""
     
+    __slots__ = ()
+    
     def _execute(self, game: 'Game', context: dict) -> bool:
         """Execute derelict ship discovery."""
         print("Your sensors detect a derelict vessel drifting nearby.")
-        print("\nOptions:")
-        print("1. Board and search for salvage")
-        print("2. Scan from a safe distance")
-        print("3. Ignore it and continue")
+        print(_DERELICT_MENU)
         
-        choice = input("\nYour choice (1-3): ").strip()
+        choice = _ask("\nYour choice (1-3): ", _MENU_CHOICES)
         
-        if choice == "1":
-            # Board the ship
-            print("\nYou dock with the derelict and board it...")
+        handler = self._CHOICES.get(choice)
+        if handler is not None:
+            handler(self, game)
+        return True
+    
+    def _board(self, game: 'Game') -> None:
+        """Board the derelict and search it."""
+        print("\nYou dock with the derelict and board it...")
+        
+        outcome = random.random()
+        if outcome < 0.3:
+            # Find valuable cargo
+            found_good = random.choice(_GOODS_KEYS)
+            quantity = random.randint(5, 15)
             
-            outcome = random.random()
-            if outcome < 0.3:
-                # Find valuable cargo
-                from ..game_data import GOODS
-                found_good = random.choice(list(GOODS.keys()))
-                quantity = random.randint(5, 15)
-                
-                if game.player.ship.get_cargo_used() + quantity <= game.player.ship.cargo_capacity:
-                    game.player.ship.add_cargo(found_good, quantity)
-                    print(f"You find {quantity} units of {found_good} in the cargo hold!")
-                else:
-                    print(f"You find {quantity} units of {found_good}, but lack cargo space.")
-                    
-            elif outcome < 0.5:
-                # Find credits
-                credits = random.randint(300, 800)
-                game.player.credits += credits
-                print(f"You recover {credits} credits from the ship's safe!")
-                
-            elif outcome < 0.7:
-                # Find ship logs (gain experience)
-                print("You find the ship's logs and learn valuable information.")
-                game.player.gain_skill("piloting", 2)
-                game.player.gain_skill("mechanics", 2)
-                game.player.ship.gain_experience("exploration", 3)
-                
+            if game.player.ship.cargo_used + quantity <= game.player.ship.cargo_capacity:
+                game.player.ship.add_cargo(found_good, quantity)
+                print(f"You find {quantity} units of {found_good} in the cargo hold!")
             else:
-                # Trap!
-                print("It's a trap! The ship's automated defenses activate!")
-                damage = random.randint(10, 25)
-                game.player.ship.hull -= damage
-                print(f"You take {damage} hull damage escaping!")
+                print(f"You find {quantity} units of {found_good}, but lack cargo space.")
                 
-        elif choice == "2":
-            # Scan only
-            print("\nYour scans reveal the ship has been stripped of valuables.")
-            print("However, you gather useful tactical data.")
-            game.player.ship.gain_experience("exploration", 2)
+        elif outcome < 0.5:
+            # Find credits
+            credits = random.randint(300, 800)
+            game.player.credits += credits
+            print(f"You recover {credits} credits from the ship's safe!")
             
-        return True
+        elif outcome < 0.7:
+            # Find ship logs (gain experience)
+            print("You find the ship's logs and learn valuable information.")
+            game.player.gain_skill("piloting", 2)
+            game.player.gain_skill("mechanics", 2)
+            game.player.ship.gain_experience("exploration", 3)
+            
+        else:
+            # Trap!
+            print("It's a trap! The ship's automated defenses activate!")
+            damage = random.randint(10, 25)
+            game.player.ship.hull -= damage
+            print(f"You take {damage} hull damage escaping!")
+    
+    def _scan(self, game: 'Game') -> None:
+        """Scan the derelict from a distance."""
+        print("\nYour scans reveal the ship has been stripped of valuables.")
+        print("However, you gather useful tactical data.")
+        game.player.ship.gain_experience("exploration", 2)
+    
+    _CHOICES = {"1": _board, "2": _scan}
 
 
 class AsteroidFieldEvent(Event):
     """Navigate through an asteroid field."""
     
+    __slots__ = ()
+    
     def _execute(self, game: 'Game', context: dict) -> bool:
         """Execute asteroid field navigation."""
         print("You've entered a dense asteroid field!")
-        print("Your navigation computer plots several routes:")
-        print("\n1. Safe route (costs 5 extra fuel)")
-        print("2. Direct route (risky but fast)")
-        print("3. Scenic route (chance to find minerals)")
-        
-        choice = input("\nYour choice (1-3): ").strip()
-        
-        if choice == "1":
-            # Safe route
-            if game.player.ship.fuel >= 5:
-                game.player.ship.fuel -= 5
-                print("\nYou carefully navigate around the asteroids.")
-                print("It takes extra fuel, but you make it through safely.")
-            else:
-                print("\nNot enough fuel for the safe route! Forced to go direct...")
-                choice = "2"
-                
-        if choice == "2":
-            # Direct route
-            dodge_chance = 0.5 + game.player.get_skill_bonus("piloting")
-            if game.player.get_crew_bonus("Navigator") > 0:
-                dodge_chance += 0.2
-                
-            if random.random() < dodge_chance:
-                print("\nSkillful piloting gets you through unscathed!")
-                game.player.gain_skill("piloting", 3)
-            else:
-                damage = random.randint(10, 30)
-                game.player.ship.hull -= damage
-                print(f"\nYou clip several asteroids! Hull damage: -{damage}")
-                
-        elif choice == "3":
-            # Scenic route
-            print("\nYou take a longer path, scanning for valuable minerals...")
+        print(_ASTEROID_MENU)
+        
+        choice = _ask("\nYour choice (1-3): ", _MENU_CHOICES)
+        
+        handler = self._CHOICES.get(choice)
+        if handler is not None:
+            handler(self, game)
+        return True
+    
+    def _safe_route(self, game: 'Game') -> None:
+        """Spend extra fuel to go around the field."""
+        if game.player.ship.fuel >= 5:
+            game.player.ship.fuel -= 5
+            print("\nYou carefully navigate around the asteroids.")
+            print("It takes extra fuel, but you make it through safely.")
+        else:
+            print("\nNot enough fuel for the safe route! Forced to go direct...")
+            self._direct_route(game)
+    
+    def _direct_route(self, game: 'Game') -> None:
+        """Fly straight through, relying on piloting."""
+        dodge_chance = 0.5 + game.player.get_skill_bonus("piloting")
+        if game.player.get_crew_bonus("Navigator") > 0:
+            dodge_chance += 0.2
             
-            if random.random() < 0.4:
-                # Find minerals
-                quantity = random.randint(10, 25)
-                if game.player.ship.get_cargo_used() + quantity <= game.player.ship.cargo_capacity:
-                    game.player.ship.add_cargo("Minerals", quantity)
-                    print(f"You extract {quantity} units of Minerals from asteroids!")
-                else:
-                    print("You find minerals but lack cargo space to collect them.")
+        if random.random() < dodge_chance:
+            print("\nSkillful piloting gets you through unscathed!")
+            game.player.gain_skill("piloting", 3)
+        else:
+            damage = random.randint(10, 30)
+            game.player.ship.hull -= damage
+            print(f"\nYou clip several asteroids! Hull damage: -{damage}")
+    
+    def _scenic_route(self, game: 'Game') -> None:
+        """Take the long way round, prospecting for minerals."""
+        print("\nYou take a longer path, scanning for valuable minerals...")
+        
+        if random.random() < 0.4:
+            # Find minerals
+            quantity = random.randint(10, 25)
+            if game.player.ship.cargo_used + quantity <= game.player.ship.cargo_capacity:
+                game.player.ship.add_cargo("Minerals", quantity)
+                print(f"You extract {quantity} units of Minerals from asteroids!")
             else:
-                print("The asteroids contain only worthless rock.")
-                
-            # Small chance of danger
-            if random.random() < 0.2:
-                damage = random.randint(5, 15)
-                game.player.ship.hull -= damage
-                print(f"A small asteroid impacts your hull! Damage: -{damage}")
-                
-        return True
+                print("You find minerals but lack cargo space to collect them.")
+        else:
+            print("The asteroids contain only worthless rock.")
+            
+        # Small chance of danger
+        if random.random() < 0.2:
+            damage = random.randint(5, 15)
+            game.player.ship.hull -= damage
+            print(f"A small asteroid impacts your hull! Damage: -{damage}")
+    
+    _CHOICES = {"1": _safe_route, "2": _direct_route, "3": _scenic_route}
+
+
+# Travel event table: (event class, id, name, description, event type,
+# trigger, base chance, requirements, weight, cooldown)
+_TRAVEL_EVENTS = (
+    (PirateEncounterEvent, "pirate_encounter", "Pirate Ambush",
+     "Pirates have detected your ship!",
+     EventType.COMBAT, EventTrigger.ON_TRAVEL, 0.15, None, 10, 0),
+    (CustomsScanEvent, "customs_scan", "Customs Inspection",
+     "A patrol ship is approaching for inspection.",
+     EventType.DIPLOMATIC, EventTrigger.ON_TRAVEL, 0.2,
+     {"faction": ["Federation", "Syndicate"]},  # No customs in Independent systems
+     8, 0),
+    (BountyHunterEvent, "bounty_hunter", "Bounty Hunter",
+     "Someone is hunting you!",
+     EventType.COMBAT, EventTrigger.ON_TRAVEL, 0.3,
+     {"min_wanted_level": 3},
+     15, 5),  # Don't spawn too frequently
+    (DerelictShipEvent, "derelict_ship", "Derelict Vessel",
+     "An abandoned ship floats in the void.",
+     EventType.DISCOVERY, EventTrigger.ON_TRAVEL, 0.1, None, 5, 0),
+    (AsteroidFieldEvent, "asteroid_field", "Asteroid Field",
+     "Navigation hazard detected!",
+     EventType.EXPLORATION, EventTrigger.ON_TRAVEL, 0.12, None, 7, 0),
+)
 
 
 def register_travel_events(registry: EventRegistry) -> None:
@@ -464,69 +607,5 @@ def register_travel_events(registry: EventRegistry) -> None:
     Args:
         registry: The event registry to register events with
     """
-    # Pirate encounter
-    pirate_config = EventConfig(
-        id="pirate_encounter",
-        name="Pirate Ambush",
-        description="Pirates have detected your ship!",
-        event_type=EventType.COMBAT,
-        trigger=EventTrigger.ON_TRAVEL,
-        base_chance=0.15,
-        weight=10
-    )
-    registry.register(PirateEncounterEvent(pirate_config))
-    
-    # Customs scan
-    customs_config = EventConfig(
-        id="customs_scan",
-        name="Customs Inspection",
-        description="A patrol ship is approaching for inspection.",
-        event_type=EventType.DIPLOMATIC,
-        trigger=EventTrigger.ON_TRAVEL,
-        base_chance=0.2,
-        requirements={
-            "faction": ["Federation", "Syndicate"]  # No customs in Independent systems
-        },
-        weight=8
-    )
-    registry.register(CustomsScanEvent(customs_config))
-    
-    # Bounty hunter
-    bounty_config = EventConfig(
-        id="bounty_hunter",
-        name="Bounty Hunter",
-        description="Someone is hunting you!",
-        event_type=EventType.COMBAT,
-        trigger=EventTrigger.ON_TRAVEL,
-        base_chance=0.3,
-        requirements={
-            "min_wanted_level": 3
-        },
-        weight=15,
-        cooldown=5  # Don't spawn too frequently
-    )
-    registry.register(BountyHunterEvent(bounty_config))
-    
-    # Derelict ship
-    derelict_config = EventConfig(
-        id="derelict_ship",
-        name="Derelict Vessel",
-        description="An abandoned ship floats in the void.",
-        event_type=EventType.DISCOVERY,
-        trigger=EventTrigger.ON_TRAVEL,
-        base_chance=0.1,
-        weight=5
-    )
-    registry.register(DerelictShipEvent(derelict_config))
-    
-    # Asteroid field
-    asteroid_config = EventConfig(
-        id="asteroid_field",
-        name="Asteroid Field",
-        description="Navigation hazard detected!",
-        event_type=EventType.EXPLORATION,
-        trigger=EventTrigger.ON_TRAVEL,
-        base_chance=0.12,
-        weight=7
-    )
-    registry.register(AsteroidFieldEvent(asteroid_config))
\ No newline at end of file
+    for event_cls, *config in _TRAVEL_EVENTS:
+        registry.register(event_cls(EventConfig(*config)))
@@ -13,6 +13,9 @@ if TYPE_CHECKING:
     from .main import Game
 
 
+_GOODS_KEYS = tuple(GOODS)
+
+
 class ExplorationEventHandler:
     """Handles special exploration events in uncharted systems."""
     
@@ -120,11 +123,10 @@ class ExplorationEventHandler:
         outcome = random.random()
         if outcome < 0.3:
             # Find cargo
-            goods = list(GOODS.keys())
-            found_good = random.choice(goods)
+            found_good = random.choice(_GOODS_KEYS)
             quantity = random.randint(5, 20)
             
-            if self.player.ship.get_cargo_used() + quantity <= self.player.ship.cargo_capacity:
+            if self.player.ship.cargo_used + quantity <= self.player.ship.cargo_capacity:
                 self.player.ship.add_cargo(found_good, quantity)
                 print(f"\nYou salvage {quantity} units of {found_good}!")
             else:
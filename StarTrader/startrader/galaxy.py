@@ -11,13 +11,100 @@ that affect gameplay across multiple systems.
 """
 
 import random
+import sys
+from math import hypot
 from .classes import StarSystem, CrewMember, Mission, AICaptain, Factory
 from .game_data import (SYSTEM_NAME_PARTS, PIRATE_NAMES, CREW_RECRUITS, 
-                      GOODS, ILLEGAL_GOODS, GALACTIC_EVENTS,
-                      FACTIONS, TECH_TYPES, PRODUCTION_RECIPES, AI_CAPTAIN_NAMES)
+                      GOODS, ILLEGAL_GOODS, BASE_PRICES, GALACTIC_EVENTS,
+                      MAJOR_FACTIONS, TECH_TYPES, PRODUCTION_RECIPES, AI_CAPTAIN_NAMES,
+                      ECONOMY_TYPES)
 from .constants import (GALAXY_WIDTH, GALAXY_HEIGHT, MAX_MISSIONS_PER_SYSTEM, 
                        MARKET_DRIFT_FACTOR)
 
+# Grid offsets of the eight cells adjacent to a system
+_NEIGHBOR_OFFSETS = tuple((dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1)
+                          if dx or dy)
+
+# Fuel cost of a hop by coordinate delta (5 per unit of distance), so adjacent
+# systems never need a square root; other deltas are added on first use
+_HOP_FUEL = {(dx, dy): int(hypot(dx, dy) * 5) for dx, dy in _NEIGHBOR_OFFSETS}
+
+
+def _base_price_rule(system_economy, good):
+    """Calculates the base price multiplier for a good in a system."""
+    # Original goods
+    if system_economy == "Agricultural" and good == "Food": return 0.6
+    if system_economy != "Agricultural" and good == "Food": return 1.4
+    if system_economy == "Industrial" and good == "Machinery": return 0.7
+    if system_economy != "Industrial" and good == "Machinery": return 1.3
+    if system_economy == "Mining" and good == "Minerals": return 0.5
+    if system_economy != "Mining" and good == "Minerals": return 1.5
+    
+    # Production chain goods
+    if system_economy == "Mining" and good == "Ore": return 0.5
+    if system_economy == "Agricultural" and good == "Crops": return 0.5
+    if system_economy == "Industrial" and good in ["Chemicals", "Alloys", "Electronics"]: return 0.7
+    if system_economy == "Agricultural" and good == "Processed Food": return 0.7
+    if system_economy == "Core" and good in ["Ship Components", "Advanced Medicine", "Quantum Processors"]: return 0.8
+    
+    # Higher prices for goods not produced locally
+    if good in ["Ore", "Alloys", "Ship Components"] and system_economy == "Agricultural": return 1.5
+    if good in ["Crops", "Processed Food"] and system_economy == "Mining": return 1.5
+    
+    return 1.0
+
+
+# Key tuples for the random pickers, built once instead of per call
+_GOODS_KEYS = tuple(GOODS)
+_ILLEGAL_KEYS = tuple(ILLEGAL_GOODS)
+_GALACTIC_EVENT_TYPES = tuple(GALACTIC_EVENTS)
+# Input stock levels a factory manager keeps on hand: three batches per input
+_FACTORY_RESTOCK_PLANS = {
+    product: tuple((good, required * 3) for good, required in recipe["inputs"].items())
+    for product, recipe in PRODUCTION_RECIPES.items()
+}
+# CrewMember positional arguments for each recruit template
+_CREW_RECRUIT_ARGS = tuple(
+    (recruit["name"], recruit["role"], recruit["skill_bonus"], recruit["salary"], recruit["description"])
+    for recruit in CREW_RECRUITS
+)
+_MISSION_TYPES = ("DELIVER", "PROCURE")
+_MISSION_TYPES_WITH_BOUNTY = _MISSION_TYPES + ("BOUNTY",)
+
+# economy -> good -> base price multiplier, evaluated once at import time
+_PRICE_MULTIPLIERS = {
+    economy: {good: _base_price_rule(economy, good) for good in BASE_PRICES}
+    for economy in (*ECONOMY_TYPES, "Core", "Independent")
+}
+
+# economy -> good -> resting market price when no event is active
+_TARGET_PRICES = {
+    economy: {good: int(BASE_PRICES[good] * multiplier) for good, multiplier in multipliers.items()}
+    for economy, multipliers in _PRICE_MULTIPLIERS.items()
+}
+
+# economy -> (multipliers, target prices), so a system resolves both with one lookup
+_PRICE_TABLES = {
+    economy: (multipliers, _TARGET_PRICES[economy])
+    for economy, multipliers in _PRICE_MULTIPLIERS.items()
+}
+
+# Local event type -> (affected good, price factor)
+_LOCAL_EVENT_EFFECTS = {
+    "famine": ("Food", 3.0),  # Famine triples food prices
+    "mining_strike": ("Minerals", 4.0),  # Strike quadruples mineral prices
+    "bountiful_harvest": ("Food", 0.5),  # Bountiful harvest halves food prices
+    "mining_boom": ("Minerals", 0.4),  # Mining boom cuts mineral prices by 60%
+}
+
+# Tech breakthrough type -> (affected good, price factor)
+_TECH_EVENT_EFFECTS = {
+    "agricultural": ("Food", 0.7),
+    "medical": ("Medicine", 0.7),
+    "mining": ("Minerals", 0.8),
+}
+
+
 class Galaxy:
     """
     Manages the game universe including systems, markets, and galactic events.
@@ -61,11 +148,10 @@ class Galaxy:
     def _init_faction_relations(self):
         """Initialize faction relationships."""
         relations = {}
-        factions = [f for f in FACTIONS.keys() if f != "Independent"]
         
-        for faction1 in factions:
+        for faction1 in MAJOR_FACTIONS:
             relations[faction1] = {}
-            for faction2 in factions:
+            for faction2 in MAJOR_FACTIONS:
                 if faction1 == faction2:
                     relations[faction1][faction2] = 100  # Perfect self-relation
                 else:
@@ -123,19 +209,16 @@ class Galaxy:
     def _populate_recruitment_offices(self):
         """Populates the recruitment offices with potential crew members."""
         # For now, all recruits are available in Sol
-        for recruit_data in CREW_RECRUITS:
-            self.systems["Sol"].recruitment_office.append(CrewMember(**recruit_data))
+        office = self.systems["Sol"].recruitment_office
+        for recruit_args in _CREW_RECRUIT_ARGS:
+            office.append(CrewMember(*recruit_args))
     
     def _generate_available_captains(self):
         """Generate AI captains available for hire."""
-        used_names = set()
         num_captains = random.randint(3, 5)
         
-        for _ in range(num_captains):
-            # Pick unique name
-            name = random.choice([n for n in AI_CAPTAIN_NAMES if n not in used_names])
-            used_names.add(name)
-            
+        # Pick unique names in one draw
+        for name in random.sample(AI_CAPTAIN_NAMES, num_captains):
             # Random experience and style
             experience = random.choice(["novice", "novice", "experienced", "veteran"])  # More novices
             style = random.choice(["aggressive", "conservative", "balanced"])
@@ -144,11 +227,11 @@ class Galaxy:
             
             # Give some preferred goods based on style
             if style == "aggressive":
-                captain.preferred_goods = random.sample(list(ILLEGAL_GOODS.keys()), min(2, len(ILLEGAL_GOODS)))
+                captain.preferred_goods = random.sample(_ILLEGAL_KEYS, min(2, len(_ILLEGAL_KEYS)))
             elif style == "conservative":
                 captain.preferred_goods = random.sample(["Food", "Medicine", "Minerals"], 2)
             else:
-                captain.preferred_goods = random.sample(list(GOODS.keys()), 3)
+                captain.preferred_goods = random.sample(_GOODS_KEYS, 3)
             
             self.available_captains.append(captain)
 
@@ -161,22 +244,23 @@ class Galaxy:
             system.available_missions = [m for m in system.available_missions if not getattr(m, 'is_complete', False)]
 
             # A system must have connections to generate missions
-            if not self.connections.get(system.name):
+            neighbors = self._neighbor_systems.get(system.name)
+            if not neighbors:
                 continue
 
-            while len(system.available_missions) < MAX_MISSIONS_PER_SYSTEM:
-                
-                # Determine possible mission types to avoid infinite loops
-                possible_types = ["DELIVER", "PROCURE"]
-                
-                # Check if a BOUNTY mission is possible
-                possible_bounty_destinations = [
-                    self.systems[s_name] for s_name in self.connections[system.name]
-                    if self.systems[s_name].faction != "Federation"
-                ]
-                if possible_bounty_destinations:
-                    possible_types.append("BOUNTY")
+            if len(system.available_missions) >= MAX_MISSIONS_PER_SYSTEM:
+                continue
 
+            # Check if a BOUNTY mission is possible; connections can grow as
+            # systems are discovered, so this is gathered once per update
+            possible_bounty_destinations = tuple(
+                neighbor for neighbor in neighbors if neighbor.faction != "Federation"
+            )
+            
+            # Determine possible mission types to avoid infinite loops
+            possible_types = _MISSION_TYPES_WITH_BOUNTY if possible_bounty_destinations else _MISSION_TYPES
+
+            while len(system.available_missions) < MAX_MISSIONS_PER_SYSTEM:
                 mission_type = random.choice(possible_types)
                 
                 if mission_type == "BOUNTY":
@@ -184,9 +268,8 @@ class Galaxy:
                     target_name = random.choice(PIRATE_NAMES)
                     mission = Mission(system, destination, system.faction, None, None, "BOUNTY", target_name)
                 else:
-                    destination_name = random.choice(self.connections[system.name])
-                    destination = self.systems[destination_name]
-                    good = random.choice(list(GOODS.keys()))
+                    destination = random.choice(neighbors)
+                    good = random.choice(_GOODS_KEYS)
                     quantity = random.randint(5, 20)
                     mission = Mission(system, destination, system.faction, good, quantity, mission_type)
 
@@ -194,45 +277,114 @@ class Galaxy:
 
     def _create_galaxy(self):
         """Creates the star systems and their connections in the galaxy."""
-        # Create a grid of systems
-        grid = [[None for _ in range(GALAXY_WIDTH)] for _ in range(GALAXY_HEIGHT)]
+        # Create a flat row-major grid of systems, indexed by y * GALAXY_WIDTH + x
+        cells = [None] * (GALAXY_WIDTH * GALAXY_HEIGHT)
         
         # Place core systems
-        grid[5][5] = StarSystem("Sol", "The bustling core of humanity.", "Core", "Federation", 5, 5, has_shipyard=True)
-        grid[4][5] = StarSystem("Alpha Centauri", "A verdant agricultural world.", "Agricultural", "Federation", 4, 5)
-        grid[5][4] = StarSystem("Sirius", "A heavily industrialized system.", "Industrial", "Syndicate", 5, 4, has_shipyard=True)
-        grid[6][4] = StarSystem("Vega", "A remote mining outpost.", "Mining", "Independent", 6, 4)
+        cells[5 * GALAXY_WIDTH + 5] = StarSystem("Sol", "The bustling core of humanity.", "Core", "Federation", 5, 5, has_shipyard=True)
+        cells[4 * GALAXY_WIDTH + 5] = StarSystem("Alpha Centauri", "A verdant agricultural world.", "Agricultural", "Federation", 4, 5)
+        cells[5 * GALAXY_WIDTH + 4] = StarSystem("Sirius", "A heavily industrialized system.", "Industrial", "Syndicate", 5, 4, has_shipyard=True)
+        cells[6 * GALAXY_WIDTH + 4] = StarSystem("Vega", "A remote mining outpost.", "Mining", "Independent", 6, 4)
 
         # Procedurally generate the rest of the systems
-        for y in range(GALAXY_HEIGHT):
-            for x in range(GALAXY_WIDTH):
-                if grid[y][x] is None and random.random() < 0.3: # 30% chance of a system
-                    name = f"{random.choice(SYSTEM_NAME_PARTS['part1'])}-{random.randint(1, 100)}"
-                    description = "An unremarkable system."
-                    economy_type = random.choice(["Agricultural", "Industrial", "Mining", "Core"])
-                    faction = random.choice(["Federation", "Syndicate", "Independent"])
-                    has_shipyard = random.random() < 0.2 # 20% chance of a shipyard
-                    grid[y][x] = StarSystem(name, description, economy_type, faction, x, y, has_shipyard)
+        for index in range(len(cells)):
+            if cells[index] is None and random.random() < 0.3: # 30% chance of a system
+                y, x = divmod(index, GALAXY_WIDTH)
+                # Interned so the many dict lookups keyed on it can match by identity
+                name = sys.intern(f"{random.choice(SYSTEM_NAME_PARTS['part1'])}-{random.randint(1, 100)}")
+                description = "An unremarkable system."
+                economy_type = random.choice(["Agricultural", "Industrial", "Mining", "Core"])
+                faction = random.choice(["Federation", "Syndicate", "Independent"])
+                has_shipyard = random.random() < 0.2 # 20% chance of a shipyard
+                cells[index] = StarSystem(name, description, economy_type, faction, x, y, has_shipyard)
 
         # Add systems to the main dictionary and create connections
-        for y in range(GALAXY_HEIGHT):
-            for x in range(GALAXY_WIDTH):
-                if grid[y][x]:
-                    self.systems[grid[y][x].name] = grid[y][x]
-                    
-                    # Connect to nearby systems
-                    for dx in range(-1, 2):
-                        for dy in range(-1, 2):
-                            if dx == 0 and dy == 0: continue
-                            nx, ny = x + dx, y + dy
-                            if 0 <= nx < GALAXY_WIDTH and 0 <= ny < GALAXY_HEIGHT and grid[ny][nx]:
-                                if grid[y][x].name not in self.connections:
-                                    self.connections[grid[y][x].name] = []
-                                self.connections[grid[y][x].name].append(grid[ny][nx].name)
-                                
-                                # Calculate fuel cost
-                                distance = self._calculate_distance(grid[y][x], grid[ny][nx])
-                                self.fuel_costs[(grid[y][x].name, grid[ny][nx].name)] = int(distance * 5)
+        fuel_costs = self.fuel_costs
+        for index, system in enumerate(cells):
+            if system is None:
+                continue
+            self.systems[system.name] = system
+            y, x = divmod(index, GALAXY_WIDTH)
+            
+            # Connect to nearby systems, building the neighbor list in one go
+            neighbors = []
+            for dx, dy in _NEIGHBOR_OFFSETS:
+                nx, ny = x + dx, y + dy
+                if 0 <= nx < GALAXY_WIDTH and 0 <= ny < GALAXY_HEIGHT:
+                    neighbor = cells[ny * GALAXY_WIDTH + nx]
+                    if neighbor is not None:
+                        neighbors.append(neighbor.name)
+                        # Fuel follows the systems' own coordinates, which for the
+                        # hand-placed core systems don't match their grid cell
+                        delta = (neighbor.x - system.x, neighbor.y - system.y)
+                        fuel_cost = _HOP_FUEL.get(delta)
+                        if fuel_cost is None:
+                            fuel_cost = _HOP_FUEL[delta] = int(hypot(*delta) * 5)
+                        fuel_costs[(system.name, neighbor.name)] = fuel_cost
+            if neighbors:
+                self.connections[system.name] = neighbors
+        
+        self._systems_tuple = tuple(self.systems.values())
+        self._lowered_system_names = tuple((name.lower(), name) for name in self.systems)
+        
+        # Resolve neighbor names to systems once for the market spillover pass
+        self._neighbor_systems = {
+            name: tuple(self.systems[n] for n in neighbors)
+            for name, neighbors in self.connections.items()
+        }
+    
+    def _system_tuple(self):
+        """Returns all systems as a tuple for random picks.
+        
+        Systems are only ever added, so the cached tuple is rebuilt whenever
+        its length falls behind the systems dict.
+        """
+        if len(self._systems_tuple) != len(self.systems):
+            self._systems_tuple = tuple(self.systems.values())
+        return self._systems_tuple
+    
+    def find_system_name(self, query):
+        """Returns the first system whose name contains the query, ignoring case.
+        
+        Lower-cased names are cached alongside the original spelling and,
+        like the systems tuple, rebuilt when new systems have been added.
+        
+        Args:
+            query: Part of a system name as typed by the player
+            
+        Returns:
+            The matching system's name, or None if nothing matches
+        """
+        if len(self._lowered_system_names) != len(self.systems):
+            self._lowered_system_names = tuple((name.lower(), name) for name in self.systems)
+        query = query.lower()
+        for lowered, name in self._lowered_system_names:
+            if query in lowered:
+                return name
+        return None
+    
+    def add_discovered_system(self, system, origin):
+        """Links a newly discovered system into the galaxy next to its origin.
+        
+        Args:
+            system: The discovered uncharted system
+            origin: The system it was discovered from
+        """
+        self.systems[system.name] = system
+        
+        # Create connections to nearby systems
+        self.connections.setdefault(origin.name, []).append(system.name)
+        self.connections[system.name] = [origin.name]
+        self._neighbor_systems[origin.name] = self._neighbor_systems.get(origin.name, ()) + (system,)
+        self._neighbor_systems[system.name] = (origin,)
+        
+        # Calculate fuel cost
+        fuel_cost = int(self._calculate_distance(origin, system) * 5)
+        self.fuel_costs[(origin.name, system.name)] = fuel_cost
+        self.fuel_costs[(system.name, origin.name)] = fuel_cost
+        
+        # Generate market for the new system only
+        self._generate_markets([system])
     
     def _create_uncharted_systems(self):
         """Create hidden systems that can be discovered through exploration."""
@@ -244,126 +396,108 @@ class Galaxy:
         
         # Create 3-5 uncharted systems
         num_uncharted = random.randint(3, 5)
-        used_positions = {(s.x, s.y) for s in self.systems.values()}
+        
+        # Cells occupied by or adjacent to an existing system are off limits
+        blocked = {(s.x + dx, s.y + dy) for s in self.systems.values()
+                   for dx in (-1, 0, 1) for dy in (-1, 0, 1)}
+        free_cells = [(x, y) for y in range(GALAXY_HEIGHT) for x in range(GALAXY_WIDTH)
+                      if (x, y) not in blocked]
         
         for i in range(num_uncharted):
-            if i >= len(uncharted_names):
+            if i >= len(uncharted_names) or not free_cells:
                 break
                 
-            # Find a valid position not too close to existing systems
-            attempts = 0
-            while attempts < 100:
-                x = random.randint(0, GALAXY_WIDTH - 1)
-                y = random.randint(0, GALAXY_HEIGHT - 1)
-                
-                # Check if position is valid (not occupied and not too close)
-                if (x, y) not in used_positions:
-                    too_close = False
-                    for px, py in used_positions:
-                        if abs(x - px) <= 1 and abs(y - py) <= 1:
-                            too_close = True
-                            break
-                    
-                    if not too_close:
-                        # Create the uncharted system
-                        name = uncharted_names[i]
-                        
-                        # Determine special properties
-                        system_type = random.choice([
-                            "ancient_ruins",
-                            "resource_rich", 
-                            "derelict_fleet",
-                            "anomaly",
-                            "pirate_haven"
-                        ])
-                        
-                        descriptions = {
-                            "ancient_ruins": "An ancient alien civilization once thrived here.",
-                            "resource_rich": "Abundant rare minerals float in dense asteroid fields.",
-                            "derelict_fleet": "Wreckage of a massive space battle drifts endlessly.",
-                            "anomaly": "Strange energy readings emanate from this mysterious system.",
-                            "pirate_haven": "A hidden base for the galaxy's most wanted criminals."
-                        }
-                        
-                        economy_types = {
-                            "ancient_ruins": "Core",
-                            "resource_rich": "Mining",
-                            "derelict_fleet": "Industrial",
-                            "anomaly": "Core",
-                            "pirate_haven": "Independent"
-                        }
-                        
-                        faction = "Independent"  # Most uncharted systems are independent
-                        if system_type == "pirate_haven":
-                            faction = "Syndicate"
-                            
-                        system = StarSystem(
-                            name, 
-                            descriptions[system_type],
-                            economy_types[system_type],
-                            faction,
-                            x, y,
-                            has_shipyard=(system_type == "pirate_haven")
-                        )
-                        
-                        # Add special properties
-                        system.is_uncharted = True
-                        system.discovered = False
-                        system.system_type = system_type
-                        system.discovery_bonus = random.randint(500, 2000)
-                        system.exploration_danger = random.uniform(0.3, 0.8)
-                        
-                        # Ancient ruins have artifacts
-                        if system_type == "ancient_ruins":
-                            system.has_artifacts = True
-                            system.artifacts_remaining = random.randint(1, 3)
-                            
-                        # Resource rich systems have special goods
-                        if system_type == "resource_rich":
-                            system.special_resource = random.choice([
-                                "Quantum Crystals", "Dark Matter", "Neutronium", "Exotic Particles"
-                            ])
-                            
-                        self.uncharted_systems[name] = system
-                        used_positions.add((x, y))
-                        break
-                        
-                attempts += 1
+            # Pick a valid position not too close to existing systems
+            x, y = random.choice(free_cells)
+            
+            # Create the uncharted system
+            name = uncharted_names[i]
+
+            # Determine special properties
+            system_type = random.choice([
+                "ancient_ruins",
+                "resource_rich", 
+                "derelict_fleet",
+                "anomaly",
+                "pirate_haven"
+            ])
+
+            descriptions = {
+                "ancient_ruins": "An ancient alien civilization once thrived here.",
+                "resource_rich": "Abundant rare minerals float in dense asteroid fields.",
+                "derelict_fleet": "Wreckage of a massive space battle drifts endlessly.",
+                "anomaly": "Strange energy readings emanate from this mysterious system.",
+                "pirate_haven": "A hidden base for the galaxy's most wanted criminals."
+            }
+
+            economy_types = {
+                "ancient_ruins": "Core",
+                "resource_rich": "Mining",
+                "derelict_fleet": "Industrial",
+                "anomaly": "Core",
+                "pirate_haven": "Independent"
+            }
+
+            faction = "Independent"  # Most uncharted systems are independent
+            if system_type == "pirate_haven":
+                faction = "Syndicate"
+
+            system = StarSystem(
+                name, 
+                descriptions[system_type],
+                economy_types[system_type],
+                faction,
+                x, y,
+                has_shipyard=(system_type == "pirate_haven")
+            )
+
+            # Add special properties; the rest are rolled by on_discovered
+            system.is_uncharted = True
+            system.discovered = False
+            system.system_type = system_type
+
+            self.uncharted_systems[name] = system
+            
+            # Keep later systems out of this one's neighborhood
+            blocked.update((x + dx, y + dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1))
+            free_cells = [cell for cell in free_cells if cell not in blocked]
 
     def _calculate_distance(self, system1, system2):
         """Calculates the distance between two systems."""
-        return ((system1.x - system2.x)**2 + (system1.y - system2.y)**2)**0.5
-
-    def _get_base_price_multiplier(self, system_economy, good):
-        """Calculates the base price multiplier for a good in a system."""
-        # Original goods
-        if system_economy == "Agricultural" and good == "Food": return 0.6
-        if system_economy != "Agricultural" and good == "Food": return 1.4
-        if system_economy == "Industrial" and good == "Machinery": return 0.7
-        if system_economy != "Industrial" and good == "Machinery": return 1.3
-        if system_economy == "Mining" and good == "Minerals": return 0.5
-        if system_economy != "Mining" and good == "Minerals": return 1.5
-        
-        # Production chain goods
-        if system_economy == "Mining" and good == "Ore": return 0.5
-        if system_economy == "Agricultural" and good == "Crops": return 0.5
-        if system_economy == "Industrial" and good in ["Chemicals", "Alloys", "Electronics"]: return 0.7
-        if system_economy == "Agricultural" and good == "Processed Food": return 0.7
-        if system_economy == "Core" and good in ["Ship Components", "Advanced Medicine", "Quantum Processors"]: return 0.8
-        
-        # Higher prices for goods not produced locally
-        if good in ["Ore", "Alloys", "Ship Components"] and system_economy == "Agricultural": return 1.5
-        if good in ["Crops", "Processed Food"] and system_economy == "Mining": return 1.5
-        
-        return 1.0
-
-    def _generate_markets(self):
-        """Generates the initial market data for each system."""
-        for system in self.systems.values():
+        return hypot(system1.x - system2.x, system1.y - system2.y)
+
+    def _economy_price_multipliers(self, system_economy):
+        """Returns the good -> base price multiplier table for an economy."""
+        return self._economy_price_tables(system_economy)[0]
+
+    def _economy_price_tables(self, system_economy):
+        """Returns the (multipliers, target prices) tables for an economy."""
+        tables = _PRICE_TABLES.get(system_economy)
+        if tables is None:
+            # Economy outside the precomputed set; evaluate the rules once and keep it
+            multipliers = {good: _base_price_rule(system_economy, good) for good in BASE_PRICES}
+            target_prices = {
+                good: int(BASE_PRICES[good] * multiplier) for good, multiplier in multipliers.items()
+            }
+            _PRICE_MULTIPLIERS[system_economy] = multipliers
+            _TARGET_PRICES[system_economy] = target_prices
+            tables = _PRICE_TABLES[system_economy] = (multipliers, target_prices)
+        return tables
+
+    def _generate_markets(self, systems=None):
+        """Generates the initial market data for each system.
+        
+        Args:
+            systems: Systems to stock; defaults to every system in the galaxy
+        """
+        if systems is None:
+            systems = self.systems.values()
+        for system in systems:
+            multipliers = self._economy_price_multipliers(system.economy_type)
             # Legal Market
             for good, data in GOODS.items():
                 base_price = data["base_price"]
-                multiplier = self._get_base_price_multiplier(system.economy_type, good)
+                multiplier = multipliers[good]
                 price = int(base_price * multiplier * random.uniform(0.9, 1.1))
                 quantity = random.randint(50, 200)
                 system.market[good] = {"price": price, "quantity": quantity}
@@ -378,48 +512,43 @@ class Galaxy:
 
     def update_markets(self):
         """Updates all markets due to natural economic drift and events."""
-        # Decay active events
-        for system_name, event in list(self.active_events.items()):
+        # Decay active events, keeping only those still running
+        live_events = {}
+        for system_name, event in self.active_events.items():
             event["duration"] -= 1
-            if event["duration"] <= 0:
+            if event["duration"] > 0:
+                live_events[system_name] = event
+            else:
                 print(f"The {event['type']} in {system_name} has ended.")
-                del self.active_events[system_name]
+        self.active_events = live_events
 
-        # Update prices
+        # Update prices; unknown goods have no base price, so they drift towards 0
+        base_prices = BASE_PRICES
+        galactic_effects = self._galactic_price_effects()
         for system in self.systems.values():
+            factors = self._price_event_factors(system, galactic_effects)
+            multipliers, target_prices = self._economy_price_tables(system.economy_type)
+            
+            if not factors:
+                # No events here, so every good heads for its precomputed resting price
+                for good, data in system.market.items():
+                    data["price"] += (target_prices.get(good, 0) - data["price"]) // MARKET_DRIFT_FACTOR
+                continue
+            
+            # Resolve the ordered factors into the sequence each good sees: goods an
+            # event names get their own, everything else shares the market-wide ones
+            shared = tuple(factor for target_good, factor in factors if target_good is None)
+            per_good = {
+                good: tuple(factor for target_good, factor in factors
+                            if target_good is None or target_good == good)
+                for good, _ in factors if good is not None
+            }
             for good, data in system.market.items():
-                base_price = GOODS.get(good, ILLEGAL_GOODS.get(good, {"base_price": 0}))["base_price"]
-                multiplier = self._get_base_price_multiplier(system.economy_type, good)
-                
-                # Check for local events
-                if system.name in self.active_events:
-                    event = self.active_events[system.name]
-                    if event["type"] == "famine" and good == "Food":
-                        multiplier *= 3.0 # Famine triples food prices
-                    if event["type"] == "mining_strike" and good == "Minerals":
-                        multiplier *= 4.0 # Strike quadruples mineral prices
-                    if event["type"] == "bountiful_harvest" and good == "Food":
-                        multiplier *= 0.5 # Bountiful harvest halves food prices
-                    if event["type"] == "mining_boom" and good == "Minerals":
-                        multiplier *= 0.4 # Mining boom cuts mineral prices by 60%
-                
-                # Check for galactic events
-                for event in self.galactic_events.values():
-                    if event["type"] == "faction_war" and system.faction in event.get("factions", []):
-                        multiplier *= 1.2  # War increases prices
-                    elif event["type"] == "tech_breakthrough":
-                        if event.get("tech_type") == "agricultural" and good == "Food":
-                            multiplier *= 0.7  # Tech reduces food prices
-                        elif event.get("tech_type") == "medical" and good == "Medicine":
-                            multiplier *= 0.7  # Tech reduces medicine prices
-                        elif event.get("tech_type") == "mining" and good == "Minerals":
-                            multiplier *= 0.8  # Tech reduces mineral prices
-                    elif event["type"] == "trade_boom" and system.faction == event.get("faction"):
-                        multiplier *= 0.9  # Trade boom reduces all prices slightly
-                    elif event["type"] == "plague" and event.get("system") == system.name and good == "Medicine":
-                        multiplier *= event["effects"]["medicine_multiplier"]  # Plague massively increases medicine prices
-
-                target_price = int(base_price * multiplier)
+                multiplier = multipliers.get(good, 1.0)
+                for factor in per_good.get(good, shared):
+                    multiplier *= factor
+
+                target_price = int(base_prices.get(good, 0) * multiplier)
                 # Drift price towards the target price
                 data["price"] += (target_price - data["price"]) // MARKET_DRIFT_FACTOR
         
@@ -427,16 +556,67 @@ class Galaxy:
         self._update_galactic_events()
         self._update_market_history()
     
+    def _galactic_price_effects(self):
+        """Resolves the active galactic events into price effects for this tick.
+        
+        Returns an ordered list of (factions, system_name, good, factor) tuples.
+        A factions or system_name of None matches any system, and a good of None
+        applies the factor to every good in the market.
+        """
+        effects = []
+        for event in self.galactic_events.values():
+            event_type = event["type"]
+            if event_type == "faction_war":
+                # War increases prices
+                effects.append((frozenset(event.get("factions", ())), None, None, 1.2))
+            elif event_type == "tech_breakthrough":
+                if event.get("tech_type") in _TECH_EVENT_EFFECTS:
+                    good, factor = _TECH_EVENT_EFFECTS[event["tech_type"]]
+                    effects.append((None, None, good, factor))
+            elif event_type == "trade_boom":
+                # Trade boom reduces all prices slightly
+                effects.append((frozenset((event.get("faction"),)), None, None, 0.9))
+            elif event_type == "plague" and event.get("system") is not None:
+                # Plague massively increases medicine prices
+                effects.append((None, event["system"], "Medicine", event["effects"]["medicine_multiplier"]))
+        return effects
+    
+    def _price_event_factors(self, system, galactic_effects):
+        """Collects the event price factors affecting a system.
+        
+        Returns an ordered list of (good, factor) pairs, where a good of None
+        applies the factor to every good in the market.
+        """
+        factors = []
+        
+        # Check for local events
+        event = self.active_events.get(system.name)
+        if event:
+            effect = _LOCAL_EVENT_EFFECTS.get(event["type"])
+            if effect:
+                factors.append(effect)
+        
+        # Check for galactic events
+        for factions, system_name, good, factor in galactic_effects:
+            if factions is not None and system.faction not in factions:
+                continue
+            if system_name is not None and system_name != system.name:
+                continue
+            factors.append((good, factor))
+        return factors
+    
     def _update_galactic_events(self):
         """Updates and potentially triggers new galactic events."""
-        # Decay existing events
-        for event_id in list(self.galactic_events.keys()):
-            event = self.galactic_events[event_id]
+        # Decay existing events, keeping only those still running
+        live_events = {}
+        for event_id, event in self.galactic_events.items():
             event["duration"] -= 1
-            if event["duration"] <= 0:
+            if event["duration"] > 0:
+                live_events[event_id] = event
+            else:
                 print(f"\n--- GALACTIC NEWS ---")
                 print(f"The {event['name']} has ended.")
-                del self.galactic_events[event_id]
+        self.galactic_events = live_events
         
         # Chance to trigger new event
         if random.random() < 0.1 and len(self.galactic_events) < 2:  # 10% chance, max 2 concurrent events
@@ -444,66 +624,54 @@ class Galaxy:
     
     def _trigger_galactic_event(self):
         """Triggers a new galactic event."""
-        event_type = random.choice(list(GALACTIC_EVENTS.keys()))
+        event_type = random.choice(_GALACTIC_EVENT_TYPES)
         event_template = GALACTIC_EVENTS[event_type]
         event_id = f"{event_type}_{random.randint(1000, 9999)}"
         
         # Generate event details based on type
-        if event_type == "faction_war":
-            factions = [f for f in FACTIONS.keys() if f != "Independent"]
-            if len(factions) >= 2:
-                faction1, faction2 = random.sample(factions, 2)
-                description = event_template["description"].format(faction1=faction1, faction2=faction2)
-                event_data = {
-                    "name": event_template["name"],
-                    "type": event_type,
-                    "duration": event_template["duration"],
-                    "description": description,
-                    "factions": [faction1, faction2],
-                    "effects": event_template["effects"]
-                }
-                # War severely damages relations
-                self.update_faction_relations(faction1, faction2, -50)
-        elif event_type == "tech_breakthrough":
-            system = random.choice(list(self.systems.values()))
-            tech_type = random.choice(TECH_TYPES)
-            description = event_template["description"].format(system=system.name, tech_type=tech_type)
-            event_data = {
-                "name": event_template["name"],
-                "type": event_type,
-                "duration": event_template["duration"],
-                "description": description,
-                "system": system.name,
-                "tech_type": tech_type,
-                "effects": event_template["effects"]
-            }
-        elif event_type == "trade_boom":
-            faction = random.choice([f for f in FACTIONS.keys() if f != "Independent"])
-            description = event_template["description"].format(faction=faction)
-            event_data = {
-                "name": event_template["name"],
-                "type": event_type,
-                "duration": event_template["duration"],
-                "description": description,
-                "faction": faction,
-                "effects": event_template["effects"]
-            }
-        elif event_type == "plague":
-            system = random.choice(list(self.systems.values()))
-            description = event_template["description"].format(system=system.name)
-            event_data = {
-                "name": event_template["name"],
-                "type": event_type,
-                "duration": event_template["duration"],
-                "description": description,
-                "system": system.name,
-                "effects": event_template["effects"]
-            }
+        details, format_args = self._GALACTIC_EVENT_BUILDERS[event_type](self)
+        description = event_template["description"].format(**format_args)
+        event_data = {
+            "name": event_template["name"],
+            "type": event_type,
+            "duration": event_template["duration"],
+            "description": description,
+            **details,
+            "effects": event_template["effects"]
+        }
         
         self.galactic_events[event_id] = event_data
         print(f"\n--- BREAKING NEWS ---")
         print(description)
     
+    # Each builder returns (event fields, description format arguments)
+    def _build_faction_war(self):
+        faction1, faction2 = random.sample(MAJOR_FACTIONS, 2)
+        # War severely damages relations
+        self.update_faction_relations(faction1, faction2, -50)
+        return {"factions": [faction1, faction2]}, {"faction1": faction1, "faction2": faction2}
+    
+    def _build_tech_breakthrough(self):
+        system = random.choice(self._system_tuple())
+        tech_type = random.choice(TECH_TYPES)
+        details = {"system": system.name, "tech_type": tech_type}
+        return details, details
+    
+    def _build_trade_boom(self):
+        details = {"faction": random.choice(MAJOR_FACTIONS)}
+        return details, details
+    
+    def _build_plague(self):
+        details = {"system": random.choice(self._system_tuple()).name}
+        return details, details
+    
+    _GALACTIC_EVENT_BUILDERS = {
+        "faction_war": _build_faction_war,
+        "tech_breakthrough": _build_tech_breakthrough,
+        "trade_boom": _build_trade_boom,
+        "plague": _build_plague,
+    }
+    
     def record_market_manipulation(self, system_name, good, quantity, action):
         """Records large trades that should affect market prices persistently."""
         # Only record trades that are significant (>30 units or >30% of market)
@@ -533,72 +701,61 @@ class Galaxy:
     
     def _update_market_history(self):
         """Updates and applies persistent market manipulation effects."""
-        systems_to_clean = []
+        updated_history = {}
         
         for system_name, goods_history in self.market_history.items():
-            goods_to_clean = []
+            system = self.systems[system_name]
+            neighbors = self._neighbor_systems.get(system_name, ())
+            active_goods = {}
             
             for good, manipulations in goods_history.items():
-                # Update and filter active manipulations
+                # Update and filter active manipulations, summing their effect as we go
                 active_manipulations = []
+                cumulative_effect = 0
                 
                 for manip in manipulations:
                     manip["duration"] -= 1
                     if manip["duration"] > 0:
                         active_manipulations.append(manip)
+                        if manip["action"] == "buy":
+                            # Large buys increase prices
+                            cumulative_effect += manip["impact"] * 0.2
+                        else:
+                            # Large sells decrease prices
+                            cumulative_effect -= manip["impact"] * 0.2
                 
-                if active_manipulations:
-                    goods_history[good] = active_manipulations
+                if not active_manipulations:
+                    continue
+                active_goods[good] = active_manipulations
+                
+                # Apply cumulative effect to market
+                entry = system.market.get(good)
+                if entry is not None:
+                    price_modifier = 1 + cumulative_effect
+                    entry["price"] = int(entry["price"] * price_modifier)
                     
-                    # Apply cumulative effect to market
-                    system = self.systems[system_name]
-                    if good in system.market:
-                        cumulative_effect = 0
-                        
-                        for manip in active_manipulations:
-                            if manip["action"] == "buy":
-                                # Large buys increase prices
-                                cumulative_effect += manip["impact"] * 0.2
-                            else:
-                                # Large sells decrease prices
-                                cumulative_effect -= manip["impact"] * 0.2
-                        
-                        # Apply the effect
-                        price_modifier = 1 + cumulative_effect
-                        system.market[good]["price"] = int(system.market[good]["price"] * price_modifier)
-                        
-                        # Affect neighboring systems with reduced impact
-                        for neighbor_name in self.connections.get(system_name, []):
-                            neighbor = self.systems[neighbor_name]
-                            if good in neighbor.market:
-                                neighbor_effect = cumulative_effect * 0.3  # 30% spillover
-                                neighbor.market[good]["price"] = int(neighbor.market[good]["price"] * (1 + neighbor_effect))
-                else:
-                    goods_to_clean.append(good)
-            
-            # Clean up expired goods
-            for good in goods_to_clean:
-                del goods_history[good]
+                    # Affect neighboring systems with reduced impact
+                    neighbor_effect = cumulative_effect * 0.3  # 30% spillover
+                    for neighbor in neighbors:
+                        neighbor_entry = neighbor.market.get(good)
+                        if neighbor_entry is not None:
+                            neighbor_entry["price"] = int(neighbor_entry["price"] * (1 + neighbor_effect))
             
-            if not goods_history:
-                systems_to_clean.append(system_name)
+            # Systems whose manipulations have all expired drop out of the history
+            if active_goods:
+                updated_history[system_name] = active_goods
         
-        # Clean up empty systems
-        for system_name in systems_to_clean:
-            del self.market_history[system_name]
+        self.market_history = updated_history
     
     def process_ai_captain_trades(self, player):
         """Process automated trades for all AI captains."""
         captain_reports = []
+        ships_by_id = {s.id: s for s in player.ships}
         
         for captain in player.ai_captains:
             if captain.assigned_ship_id:
                 # Find the assigned ship
-                ship = None
-                for s in player.ships:
-                    if s.id == captain.assigned_ship_id:
-                        ship = s
-                        break
+                ship = ships_by_id.get(captain.assigned_ship_id)
                 
                 if ship and ship.location and captain.trade_route:
                     report = self._execute_captain_trade(captain, ship)
@@ -630,9 +787,9 @@ class Galaxy:
                     captain.total_profit += trade_profit
                     return f"{captain.name} made {trade_profit} credits trading at {ship.location}"
             else:
-                # Travel to target
-                if target_system_name in self.connections.get(ship.location, []):
-                    fuel_cost = self.fuel_costs.get((ship.location, target_system_name), 10)
+                # Travel to target; every connection has a fuel cost recorded
+                if target_system_name in self.connections.get(ship.location, ()):
+                    fuel_cost = self.fuel_costs[(ship.location, target_system_name)]
                     
                     if ship.fuel >= fuel_cost:
                         ship.fuel -= fuel_cost
@@ -652,33 +809,42 @@ class Galaxy:
         """Execute trades at a system."""
         total_profit = 0
         cargo_space = ship.cargo_capacity - ship.get_cargo_used()
+        margin = captain.get_profit_margin()
+        sell_threshold = 1 + margin
+        buy_threshold = 1 - margin
         
-        # Sell goods if profitable
-        for good, quantity in list(ship.cargo_hold.items()):
-            if good in system.market:
-                sell_price = system.market[good]["price"]
+        # Sell goods if profitable; cargo is unloaded after the scan
+        market = system.market
+        sold = []
+        for good, quantity in ship.cargo_hold.items():
+            entry = market.get(good)
+            if entry is not None:
+                sell_price = entry["price"]
                 # Captains know approximate buy prices
-                estimated_buy_price = GOODS.get(good, ILLEGAL_GOODS.get(good, {"base_price": 100}))["base_price"]
+                estimated_buy_price = BASE_PRICES.get(good, 100)
                 
-                if sell_price > estimated_buy_price * (1 + captain.get_profit_margin()):
+                if sell_price > estimated_buy_price * sell_threshold:
                     # Sell
-                    system.market[good]["quantity"] += quantity
-                    ship.remove_cargo(good, quantity)
+                    entry["quantity"] += quantity
+                    sold.append((good, quantity))
                     profit = sell_price * quantity
                     total_profit += profit
                     cargo_space += quantity
+        for good, quantity in sold:
+            ship.remove_cargo(good, quantity)
         
         # Buy goods that look profitable
         for good in captain.preferred_goods:
-            if good in system.market and cargo_space > 0:
-                buy_price = system.market[good]["price"]
-                base_price = GOODS.get(good, ILLEGAL_GOODS.get(good, {"base_price": 100}))["base_price"]
+            entry = market.get(good)
+            if entry is not None and cargo_space > 0:
+                buy_price = entry["price"]
+                base_price = BASE_PRICES.get(good, 100)
                 
                 # Buy if price is low
-                if buy_price < base_price * (1 - captain.get_profit_margin()):
-                    quantity = min(cargo_space, system.market[good]["quantity"], 20)
+                if buy_price < base_price * buy_threshold:
+                    quantity = min(cargo_space, entry["quantity"], 20)
                     if quantity > 0 and captain.total_profit >= buy_price * quantity:
-                        system.market[good]["quantity"] -= quantity
+                        entry["quantity"] -= quantity
                         ship.add_cargo(good, quantity)
                         captain.total_profit -= buy_price * quantity
                         cargo_space -= quantity
@@ -713,22 +879,25 @@ class Galaxy:
             
             # If factory has a manager, try to buy inputs automatically
             if factory.manager and player.credits > 1000:
-                recipe = factory.get_recipe()
-                if recipe:
-                    for input_good, required in recipe["inputs"].items():
-                        current = factory.storage.get(input_good, 0)
-                        needed = max(0, required * 3 - current)  # Keep 3 batches in stock
+                plan = _FACTORY_RESTOCK_PLANS.get(factory.product)
+                if plan:
+                    market = system.market
+                    storage = factory.storage
+                    credits = player.credits
+                    for input_good, stock_target in plan:
+                        needed = stock_target - storage.get(input_good, 0)
                         
-                        if needed > 0 and input_good in system.market:
-                            price = system.market[input_good]["price"]
-                            available = system.market[input_good]["quantity"]
-                            to_buy = min(needed, available, player.credits // price)
+                        entry = market.get(input_good)
+                        if needed > 0 and entry is not None:
+                            price = entry["price"]
+                            to_buy = min(needed, entry["quantity"], credits // price)
                             
                             if to_buy > 0:
                                 cost = to_buy * price
-                                player.credits -= cost
-                                system.market[input_good]["quantity"] -= to_buy
-                                factory.add_input(input_good, to_buy)
+                                credits -= cost
+                                entry["quantity"] -= to_buy
+                                storage[input_good] = storage.get(input_good, 0) + to_buy
                                 factory_reports.append(f"Factory manager bought {to_buy} {input_good} for {cost} credits")
+                    player.credits = credits
         
         return factory_reports
@@ -7,8 +7,8 @@ Over time, modules should import directly from the data submodules instead of th
 
 # Import from reorganized data modules
 from .data.ships import SHIP_CLASSES, MODULE_SPECS, OLD_MODULE_SPECS
-from .data.goods import GOODS, ILLEGAL_GOODS, PRODUCTION_RECIPES
-from .data.factions import FACTIONS, FACTION_RANKS, RANK_BENEFITS
+from .data.goods import GOODS, ILLEGAL_GOODS, BASE_PRICES, PRODUCTION_RECIPES
+from .data.factions import FACTIONS, MAJOR_FACTIONS, FACTION_RANKS, RANK_BENEFITS
 from .data.crew import CREW_RECRUITS, AI_CAPTAIN_NAMES, CREW_ROLES, AI_CAPTAIN_LEVELS
 from .data.generation import (
     SYSTEM_NAME_PARTS, PIRATE_NAMES, GALACTIC_EVENTS, TECH_TYPES,
@@ -21,10 +21,10 @@ __all__ = [
     'SHIP_CLASSES', 'MODULE_SPECS', 'OLD_MODULE_SPECS',
     
     # Goods
-    'GOODS', 'ILLEGAL_GOODS', 'PRODUCTION_RECIPES',
+    'GOODS', 'ILLEGAL_GOODS', 'BASE_PRICES', 'PRODUCTION_RECIPES',
     
     # Factions
-    'FACTIONS', 'FACTION_RANKS', 'RANK_BENEFITS',
+    'FACTIONS', 'MAJOR_FACTIONS', 'FACTION_RANKS', 'RANK_BENEFITS',
     
     # Crew
     'CREW_RECRUITS', 'AI_CAPTAIN_NAMES', 'CREW_ROLES', 'AI_CAPTAIN_LEVELS',
@@ -17,12 +17,15 @@ The game features:
 - Rich galaxy with events and factions
 """
 
+import sys
 import time
 import random
-from .classes import Player, Ship, Mission, CrewMember, AICaptain, Factory
+from functools import cached_property
+from types import MappingProxyType
+from .classes import Player, Ship, Mission, CrewMember, AICaptain, Factory, WANTED_STARS
 from .galaxy import Galaxy
 from .event_system import EventManager as NewEventManager
-from .game_data import (FACTIONS, ILLEGAL_GOODS, MODULE_SPECS, SHIP_CLASSES, GOODS)
+from .game_data import (MAJOR_FACTIONS, ILLEGAL_GOODS, MODULE_SPECS, SHIP_CLASSES, GOODS)
 from .constants import (TRADING_SHIP_BONUS_PER_LEVEL, REPUTATION_DISCOUNT_THRESHOLD,
                        REPAIR_COST_PER_HP, FUEL_COST_PER_UNIT, EVENT_CHANCE,
                        PRICE_IMPACT_FACTOR, QUANTITY_IMPACT_DIVISOR)
@@ -42,10 +45,11 @@ from .encyclopedia import Encyclopedia
 from .production import ProductionManager
 from .ui import UIManager
 from .game_mechanics import GameMechanicsManager
+from .combat import TacticalCombat, WeaponRange
 
 # --- Game Balance Constants ---
-# Most constants moved to constants.py
-CONSTANTS = {
+# Most constants moved to constants.py; read-only so no game can alter them
+CONSTANTS = MappingProxyType({
     "REPAIR_COST_PER_HP": REPAIR_COST_PER_HP,
     "FUEL_COST_PER_UNIT": FUEL_COST_PER_UNIT,
     "EVENT_CHANCE": EVENT_CHANCE,
@@ -53,6 +57,71 @@ CONSTANTS = {
     "PRICE_IMPACT_FACTOR": PRICE_IMPACT_FACTOR,
     "QUANTITY_IMPACT_DIVISOR": QUANTITY_IMPACT_DIVISOR,
     "SAVE_FILE_NAME": "savegame.json"
+})
+
+# Game attributes built lazily through cached_property
+_LAZY_HANDLERS = ("factory_commands", "captain_commands", "help_system", "encyclopedia")
+
+# Each pair of major factions once, in the order the news reports them,
+# with the pair's label already formatted
+_FACTION_PAIRS = tuple(
+    (faction1, faction2, f"  {faction1} ↔ {faction2}:")
+    for faction1 in MAJOR_FACTIONS for faction2 in MAJOR_FACTIONS
+    if faction1 < faction2
+)
+
+# Lower-cased good name -> its canonical spelling
+_GOOD_BY_LOWER = {good.lower(): good for good in (*GOODS, *ILLEGAL_GOODS)}
+
+
+def _canonical_good_name(words):
+    """Joins typed words into a good name, using the game's spelling when known."""
+    key = " ".join(words).lower()
+    return _GOOD_BY_LOWER.get(key) or key.title()
+
+
+# Enemy line-ups for the tactical combat demo; TacticalCombat only reads them
+_SINGLE_ENEMY = (
+    {
+        "name": "Pirate Raider",
+        "type": "pirate",
+        "hull": 50,
+        "shield": 20,
+        "damage": 15,
+        "range": WeaponRange.MEDIUM,
+        "speed": 2,
+        "evasion": 10
+    },
+)
+_MULTI_ENEMIES = (
+    {
+        "name": "Pirate Leader",
+        "type": "pirate",
+        "hull": 60,
+        "shield": 30,
+        "damage": 20,
+        "range": WeaponRange.LONG,
+        "speed": 2,
+        "evasion": 15
+    },
+    {
+        "name": "Pirate Wingman",
+        "type": "pirate",
+        "hull": 40,
+        "shield": 10,
+        "damage": 15,
+        "range": WeaponRange.SHORT,
+        "speed": 3,
+        "evasion": 20
+    },
+)
+
+# Economic event type -> news headline
+_ECONOMIC_HEADLINES = {
+    "famine": "  - URGENT: A severe famine continues in the {system} system. Demand for Food is critical.",
+    "mining_strike": "  - BUSINESS: A labor strike in the {system} system has halted mineral production.",
+    "bountiful_harvest": "  - BUSINESS: A bountiful harvest in the {system} system has led to a surplus of Food.",
+    "mining_boom": "  - BUSINESS: A mineral boom in the {system} system has flooded the market.",
 }
 
 class Game:
@@ -94,6 +163,7 @@ class Game:
         self.player.location = self.galaxy.systems["Sol"]
         self.current_day = 1
         self.constants = CONSTANTS
+        self.save_file_name = CONSTANTS["SAVE_FILE_NAME"]
         
         # Initialize command handlers
         self.trading_commands = TradingCommands(self)
@@ -101,27 +171,23 @@ class Game:
         self.ship_commands = ShipCommands(self)
         self.mission_commands = MissionCommands(self)
         self.crew_commands = CrewCommands(self)
-        self.factory_commands = FactoryCommands(self)
-        self.captain_commands = CaptainCommands(self)
+        # Rarely used handlers are built on first use; drop any left over
+        # from a previous game so they bind to this game's player and galaxy
+        for name in _LAZY_HANDLERS:
+            self.__dict__.pop(name, None)
         
         # Initialize trade analyzer
         self.trade_analyzer = TradeAnalyzer(self.galaxy, self.player)
         
         # Initialize save/load manager
-        self.save_load_manager = SaveLoadManager(self.constants['SAVE_FILE_NAME'])
+        self.save_load_manager = SaveLoadManager(self.save_file_name)
         
         # Initialize victory manager
         self.victory_manager = VictoryManager()
         
-        # Initialize help system
-        self.help_system = HelpSystem()
-        
         # Initialize exploration event handler
         self.exploration_handler = ExplorationEventHandler(self)
         
-        # Initialize encyclopedia
-        self.encyclopedia = Encyclopedia()
-        
         # Initialize production manager
         self.production_manager = ProductionManager(self)
         
@@ -133,6 +199,28 @@ class Game:
         
         # Initialize commands dictionary
         self._setup_commands()
+        # The command table is fixed for the game's lifetime, so list it once
+        self._commands_banner = f"Commands: {', '.join(self.commands)}"
+
+    @cached_property
+    def factory_commands(self):
+        """Factory command handlers, built on first use."""
+        return FactoryCommands(self)
+
+    @cached_property
+    def captain_commands(self):
+        """AI captain command handlers, built on first use."""
+        return CaptainCommands(self)
+
+    @cached_property
+    def help_system(self):
+        """Help system, built on first use."""
+        return HelpSystem()
+
+    @cached_property
+    def encyclopedia(self):
+        """Encyclopedia, built on first use."""
+        return Encyclopedia()
 
     def validate_command(self, parts, min_args, usage_msg):
         """Validate command has minimum arguments. Returns True if valid."""
@@ -143,6 +231,11 @@ class Game:
 
     def calculate_trade_bonus(self):
         """Calculate total trading bonus from crew, skills, and ship."""
+        negotiator_bonus, skill_bonus, ship_bonus = self.get_trade_bonus_sources()
+        return negotiator_bonus + skill_bonus + ship_bonus
+
+    def get_trade_bonus_sources(self):
+        """Get the (negotiator, skill, ship) parts of the trading bonus."""
         negotiator_bonus = self.player.get_crew_bonus("Negotiator")
         skill_bonus = self.player.get_skill_bonus("negotiation")
         
@@ -152,7 +245,7 @@ class Game:
         if ship.specialization == "trading":
             ship_bonus = (ship.level - 1) * TRADING_SHIP_BONUS_PER_LEVEL
             
-        return negotiator_bonus + skill_bonus + ship_bonus
+        return negotiator_bonus, skill_bonus, ship_bonus
 
     def get_status(self):
         """Get the player's status display."""
@@ -223,21 +316,21 @@ class Game:
             "recipes": self._handle_recipes,
             
             # AI Captain commands (from module)
-            "captains": self.captain_commands.handle_captains,
-            "hirecaptain": self.captain_commands.handle_hire_captain,
-            "assigncaptain": self.captain_commands.handle_assign_captain,
-            "setroute": self.captain_commands.handle_set_route,
-            "firecaptain": self.captain_commands.handle_fire_captain,
-            "captainstatus": self.captain_commands.handle_captain_status,
+            "captains": lambda parts: self.captain_commands.handle_captains(parts),
+            "hirecaptain": lambda parts: self.captain_commands.handle_hire_captain(parts),
+            "assigncaptain": lambda parts: self.captain_commands.handle_assign_captain(parts),
+            "setroute": lambda parts: self.captain_commands.handle_set_route(parts),
+            "firecaptain": lambda parts: self.captain_commands.handle_fire_captain(parts),
+            "captainstatus": lambda parts: self.captain_commands.handle_captain_status(parts),
             
             # Factory commands (from module)
-            "buildfactory": self.factory_commands.handle_build_factory,
-            "factories": self.factory_commands.handle_factories,
-            "factorysupply": self.factory_commands.handle_factory_supply,
-            "factorycollect": self.factory_commands.handle_factory_collect,
-            "factoryupgrade": self.factory_commands.handle_factory_upgrade,
-            "hirefactorymanager": self.factory_commands.handle_hire_factory_manager,
-            "factorymanager": self.factory_commands.handle_factory_manager,
+            "buildfactory": lambda parts: self.factory_commands.handle_build_factory(parts),
+            "factories": lambda parts: self.factory_commands.handle_factories(parts),
+            "factorysupply": lambda parts: self.factory_commands.handle_factory_supply(parts),
+            "factorycollect": lambda parts: self.factory_commands.handle_factory_collect(parts),
+            "factoryupgrade": lambda parts: self.factory_commands.handle_factory_upgrade(parts),
+            "hirefactorymanager": lambda parts: self.factory_commands.handle_hire_factory_manager(parts),
+            "factorymanager": lambda parts: self.factory_commands.handle_factory_manager(parts),
             
             # Analysis commands (still in main)
             "cargo": self._handle_cargo,
@@ -248,10 +341,15 @@ class Game:
     
     def run(self):
         """The main game loop."""
+        try:
+            import readline  # noqa: F401 - gives input() line editing and history
+        except ImportError:
+            pass  # Not available on every platform
+        
         print("Welcome to Star Trader!")
         print("Your goal is to make a fortune trading between the stars.")
         
-        print(f"Commands: {', '.join(self.commands.keys())}")
+        print(self._commands_banner)
         
         if self.save_load_manager.save_exists():
             print("Save file found. Use 'load' to continue or 'new' to start a new game.")
@@ -260,12 +358,16 @@ class Game:
 
         while not self.game_over:
             command = input("> ").strip().lower()
-            parts = command.split()
-            verb = parts[0] if parts else ""
+            # Split off the verb at the first run of whitespace and only tokenize
+            # the rest once it is known to be a command; interning lets a hit
+            # match the interned table key by identity
+            words = command.split(None, 1)
+            verb = sys.intern(words[0]) if words else ""
+            rest = words[1] if len(words) > 1 else ""
             
             handler = self.commands.get(verb)
             if handler:
-                handler(parts)
+                handler([verb, *rest.split()])
             else:
                 print(f"Unknown command: '{command}'")
         
@@ -273,57 +375,52 @@ class Game:
 
     def _handle_news(self, parts):
         """Displays galactic news and events."""
-        print(f"\n--- Galactic News Network (GNN) - Day {self.current_day} ---")
+        # Collect the report and print it in one go
+        lines = [f"\n--- Galactic News Network (GNN) - Day {self.current_day} ---"]
+        add = lines.append
         
         news_items = 0
         
         # Faction relations
-        factions = [f for f in FACTIONS.keys() if f != "Independent"]
-        print("\n-- Faction Relations --")
-        for faction1 in factions:
-            for faction2 in factions:
-                if faction1 < faction2:  # Avoid duplicates
-                    status = self.galaxy.get_faction_relation_status(faction1, faction2)
-                    value = self.galaxy.faction_relations[faction1][faction2]
-                    print(f"  {faction1} ↔ {faction2}: {status} ({value:+d})")
+        add("\n-- Faction Relations --")
+        relations = self.galaxy.faction_relations
+        for faction1, faction2, label in _FACTION_PAIRS:
+            status = self.galaxy.get_faction_relation_status(faction1, faction2)
+            add(f"{label} {status} ({relations[faction1][faction2]:+d})")
         news_items += 1
         
         # Report on galactic events
         if self.galaxy.galactic_events:
-            print("\n-- Major Galactic Events --")
+            add("\n-- Major Galactic Events --")
             for event in self.galaxy.galactic_events.values():
-                print(f"  - {event['description']} (Day {event['duration']} remaining)")
+                add(f"  - {event['description']} (Day {event['duration']} remaining)")
                 news_items += 1
         
         # Report on active economic events
         if self.galaxy.active_events:
-            print("\n-- Economic Events --")
+            add("\n-- Economic Events --")
             for system_name, event in self.galaxy.active_events.items():
-                if event["type"] == "famine":
-                    print(f"  - URGENT: A severe famine continues in the {system_name} system. Demand for Food is critical.")
-                elif event["type"] == "mining_strike":
-                    print(f"  - BUSINESS: A labor strike in the {system_name} system has halted mineral production.")
-                elif event["type"] == "bountiful_harvest":
-                    print(f"  - BUSINESS: A bountiful harvest in the {system_name} system has led to a surplus of Food.")
-                elif event["type"] == "mining_boom":
-                    print(f"  - BUSINESS: A mineral boom in the {system_name} system has flooded the market.")
+                headline = _ECONOMIC_HEADLINES.get(event["type"])
+                if headline:
+                    add(headline.format(system=system_name))
                 news_items += 1
         
         # Report on available bounty missions across the galaxy
-        bounties = []
-        for system in self.galaxy.systems.values():
-            for mission in system.available_missions:
-                if mission.type == "BOUNTY":
-                    bounties.append(mission)
-                    
+        bounties = [
+            mission
+            for system in self.galaxy.systems.values()
+            for mission in system.available_missions if mission.type == "BOUNTY"
+        ]
+        
         if bounties:
-            print("\n-- Bounties Posted --")
+            add("\n-- Bounties Posted --")
             for bounty in bounties:
-                print(f"  - WANTED: The pirate {bounty.target_name} is wanted by the {bounty.faction}. Last seen near {bounty.destination_system.name}.")
+                add(f"  - WANTED: The pirate {bounty.target_name} is wanted by the {bounty.faction}. Last seen near {bounty.destination_system.name}.")
             news_items += len(bounties)
             
         if news_items == 0:
-            print("\nNo major news to report across the galaxy.")
+            add("\nNo major news to report across the galaxy.")
+        print("\n".join(lines))
 
     def _handle_recipes(self, parts):
         """Shows available production recipes at the current location."""
@@ -335,7 +432,7 @@ class Game:
             print("Invalid format. Use: produce <product>")
             return
             
-        product_name = " ".join(parts[1:]).title()
+        product_name = _canonical_good_name(parts[1:])
         self.production_manager.produce_good(product_name)
 
     def _handle_new(self, parts):
@@ -360,12 +457,12 @@ class Game:
     def _handle_cargo(self, parts):
         """Shows just the cargo hold contents."""
         ship = self.player.ship
-        print(f"\n--- Cargo Hold ({ship.get_cargo_used()}/{ship.cargo_capacity}) ---")
+        lines = [f"\n--- Cargo Hold ({ship.get_cargo_used()}/{ship.cargo_capacity}) ---"]
         if ship.cargo_hold:
-            for good, quantity in sorted(ship.cargo_hold.items()):
-                print(f"  {good}: {quantity}")
+            lines.extend(f"  {good}: {quantity}" for good, quantity in ship.sorted_cargo())
         else:
-            print("  Empty")
+            lines.append("  Empty")
+        print("\n".join(lines))
     
     def _handle_clear_wanted(self, parts):
         """Pay to clear wanted status through underground contacts."""
@@ -379,80 +476,81 @@ class Game:
             print("Try a Syndicate or Independent system.")
             return
             
-        print("\n--- UNDERGROUND CONTACT ---")
-        print("A shady figure approaches you in a dark corner of the station...")
-        print("\"I can make your problems... disappear. For a price.\"")
-        print()
+        lines = [
+            "\n--- UNDERGROUND CONTACT ---",
+            "A shady figure approaches you in a dark corner of the station...",
+            "\"I can make your problems... disappear. For a price.\"",
+            "",
+        ]
         
         # Show current wanted status
         if self.player.wanted_level > 0:
-            print(f"Global Wanted Level: {'★' * self.player.wanted_level}")
+            lines.append(f"Global Wanted Level: {WANTED_STARS[self.player.wanted_level]}")
         
         for faction, level in self.player.wanted_by.items():
-            print(f"{faction} Wanted Level: {'★' * level}")
+            lines.append(f"{faction} Wanted Level: {WANTED_STARS[level]}")
         
         # Calculate costs
-        print("\nClearing Options:")
+        lines.append("\nClearing Options:")
         options = []
         
+        # Syndicate rank gives discount
+        price_factor = 1.0
+        if self.player.location.faction == "Syndicate":
+            benefits = self.player.get_rank_benefits("Syndicate")
+            price_factor = 1 - benefits.get("black_market_discount", 0)
+        
         if self.player.wanted_level > 0:
-            cost = self.player.wanted_level * 3000
-            # Syndicate rank gives discount
-            if self.player.location.faction == "Syndicate":
-                benefits = self.player.get_rank_benefits("Syndicate")
-                if "black_market_discount" in benefits:
-                    cost = int(cost * (1 - benefits["black_market_discount"]))
+            cost = int(self.player.wanted_level * 3000 * price_factor)
             options.append(("global", cost, f"Clear global wanted status: {cost} credits"))
             
         for faction, level in self.player.wanted_by.items():
-            cost = level * 2500
-            # Syndicate rank gives discount
-            if self.player.location.faction == "Syndicate":
-                benefits = self.player.get_rank_benefits("Syndicate")
-                if "black_market_discount" in benefits:
-                    cost = int(cost * (1 - benefits["black_market_discount"]))
+            cost = int(level * 2500 * price_factor)
             options.append((faction, cost, f"Clear {faction} wanted status: {cost} credits"))
         
-        # Display options
+        # Display the contact, wanted status and options together
         for i, (target, cost, desc) in enumerate(options):
-            print(f"{i+1}. {desc}")
-        print(f"{len(options)+1}. Never mind")
+            lines.append(f"{i+1}. {desc}")
+        lines.append(f"{len(options)+1}. Never mind")
+        print("\n".join(lines))
         
         choice = input("\nYour choice: ").strip()
         
-        try:
-            choice_idx = int(choice) - 1
-            if choice_idx == len(options):
-                print("You decide to keep your wanted status for now.")
-                return
+        # isdecimal() only accepts characters int() can parse, so no ValueError
+        if not choice.isdecimal():
+            print("Invalid choice.")
+            return
+
+        choice_idx = int(choice) - 1
+        if choice_idx == len(options):
+            print("You decide to keep your wanted status for now.")
+            return
                 
-            if 0 <= choice_idx < len(options):
-                target, cost, _ = options[choice_idx]
+        if 0 <= choice_idx < len(options):
+            target, cost, _ = options[choice_idx]
                 
-                if self.player.credits >= cost:
-                    self.player.credits -= cost
+            if self.player.credits >= cost:
+                self.player.credits -= cost
                     
-                    if target == "global":
-                        self.player.wanted_level = 0
-                        print("\nThe contact makes a few calls...")
-                        print("\"It's done. Your record has been... cleaned.\"")
-                        print("Your global wanted status has been cleared!")
-                    else:
-                        level = self.player.wanted_by[target]
-                        self.player.decrease_wanted_level(target, level)
-                        print(f"\nThe contact taps into the {target} database...")
-                        print("\"Consider yourself a ghost in their system.\"")
-                        print(f"Your wanted status with {target} has been cleared!")
-                        
-                    # Gain some Syndicate reputation for using their services
-                    if self.player.location.faction == "Syndicate":
-                        self.player.add_reputation("Syndicate", 5)
+                if target == "global":
+                    self.player.wanted_level = 0
+                    print("\nThe contact makes a few calls...")
+                    print("\"It's done. Your record has been... cleaned.\"")
+                    print("Your global wanted status has been cleared!")
                 else:
-                    print(f"\nYou need {cost} credits but only have {self.player.credits}.")
-                    print("\"Come back when you have the money.\"")
+                    level = self.player.wanted_by[target]
+                    self.player.decrease_wanted_level(target, level)
+                    print(f"\nThe contact taps into the {target} database...")
+                    print("\"Consider yourself a ghost in their system.\"")
+                    print(f"Your wanted status with {target} has been cleared!")
+                        
+                # Gain some Syndicate reputation for using their services
+                if self.player.location.faction == "Syndicate":
+                    self.player.add_reputation("Syndicate", 5)
             else:
-                print("Invalid choice.")
-        except ValueError:
+                print(f"\nYou need {cost} credits but only have {self.player.credits}.")
+                print("\"Come back when you have the money.\"")
+        else:
             print("Invalid choice.")
     
     
@@ -471,7 +569,7 @@ class Game:
         if analysis_type == "markets":
             self.trade_analyzer.analyze_markets()
         elif analysis_type == "good" and len(parts) > 2:
-            good_name = " ".join(parts[2:]).title()
+            good_name = _canonical_good_name(parts[2:])
             self.trade_analyzer.analyze_good(good_name)
         elif analysis_type == "routes":
             self.trade_analyzer.analyze_trade_routes()
@@ -511,47 +609,12 @@ class Game:
         print("\n--- TACTICAL COMBAT SIMULATION ---")
         print("This will start a tactical combat encounter for testing.")
         
-        from .combat import TacticalCombat, WeaponRange
-        
-        # Create enemy configuration
-        enemy_configs = []
-        
+        # Pick the enemy configuration
         if len(parts) > 1 and parts[1] == "multi":
             # Multiple enemies for more interesting combat
-            enemy_configs = [
-                {
-                    "name": "Pirate Leader",
-                    "type": "pirate",
-                    "hull": 60,
-                    "shield": 30,
-                    "damage": 20,
-                    "range": WeaponRange.LONG,
-                    "speed": 2,
-                    "evasion": 15
-                },
-                {
-                    "name": "Pirate Wingman",
-                    "type": "pirate", 
-                    "hull": 40,
-                    "shield": 10,
-                    "damage": 15,
-                    "range": WeaponRange.SHORT,
-                    "speed": 3,
-                    "evasion": 20
-                }
-            ]
+            enemy_configs = _MULTI_ENEMIES
         else:
-            # Single enemy
-            enemy_configs = [{
-                "name": "Pirate Raider",
-                "type": "pirate",
-                "hull": 50,
-                "shield": 20,
-                "damage": 15,
-                "range": WeaponRange.MEDIUM,
-                "speed": 2,
-                "evasion": 10
-            }]
+            enemy_configs = _SINGLE_ENEMY
         
         # Run tactical combat
         combat = TacticalCombat(self.player.ship, enemy_configs, self)
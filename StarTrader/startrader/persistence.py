@@ -336,6 +336,6 @@ class SaveLoadManager:
             for name in galaxy_data["uncharted_discovered"]:
                 if name in galaxy.uncharted_systems:
                     system = galaxy.uncharted_systems[name]
-                    system.discovered = True
+                    system.on_discovered()
                     # Re-add to main systems if discovered
                     galaxy.systems[name] = system
\ No newline at end of file
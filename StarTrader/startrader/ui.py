@@ -6,6 +6,7 @@ and game state to the user.
 """
 
 from typing import TYPE_CHECKING
+from .classes import WANTED_STARS
 from .game_data import FACTIONS
 
 if TYPE_CHECKING:
@@ -29,8 +30,9 @@ class UIManager:
         Returns:
             Formatted status string
         """
-        ship = self.game.player.ship
-        system = self.game.player.location
+        player = self.game.player
+        ship = player.ship
+        system = player.location
         connections = self.game.galaxy.connections.get(system.name, [])
         travel_options = ", ".join(connections) or "None"
         cargo_list = ", ".join(f"{item} ({qty})" for item, qty in ship.cargo_hold.items()) or "Empty"
@@ -38,73 +40,79 @@ class UIManager:
         # Get faction ranks
         faction_ranks = []
         for faction in ["Federation", "Syndicate"]:
-            rank = self.game.player.get_faction_rank(faction)
-            rep = self.game.player.reputation.get(faction, 0)
+            rank = player.get_faction_rank(faction)
+            rep = player.reputation.get(faction, 0)
             faction_ranks.append(f"{faction}: {rank['title']} (Rep: {rep})")
         
         # Get wanted status
         wanted_str = ""
-        if self.game.player.wanted_level > 0:
-            wanted_str = f"Global Wanted: {'★' * self.game.player.wanted_level} | "
-        if self.game.player.wanted_by:
-            faction_wanted = [f"{f}: {'★' * level}" for f, level in self.game.player.wanted_by.items()]
+        if player.wanted_level > 0:
+            wanted_str = f"Global Wanted: {WANTED_STARS[player.wanted_level]} | "
+        if player.wanted_by:
+            faction_wanted = [f"{f}: {WANTED_STARS[level]}" for f, level in player.wanted_by.items()]
             wanted_str += " | ".join(faction_wanted)
         
-        status = (
-            f"--- Captain {self.game.player.name} ---\n"
-            f"Credits: {self.game.player.credits}\n"
-            f"Skills: Piloting {self.game.player.skills['piloting']} | Negotiation {self.game.player.skills['negotiation']} | Mechanics {self.game.player.skills['mechanics']} | Leadership {self.game.player.skills['leadership']}\n"
-            f"Faction Ranks: {' | '.join(faction_ranks)}\n"
-        )
+        # Collect the display line by line and join it once at the end
+        skills = player.skills
+        lines = [
+            f"--- Captain {player.name} ---",
+            f"Credits: {player.credits}",
+            f"Skills: Piloting {skills['piloting']} | Negotiation {skills['negotiation']} | Mechanics {skills['mechanics']} | Leadership {skills['leadership']}",
+            f"Faction Ranks: {' | '.join(faction_ranks)}",
+        ]
+        add = lines.append
         
         if wanted_str:
-            status += f"WANTED STATUS: {wanted_str}\n"
+            add(f"WANTED STATUS: {wanted_str}")
             
-        status += (
-            f"\n--- Current Location: {system.name} ({system.economy_type})\n"
-            f"System Faction: {system.faction} ({FACTIONS[system.faction]['name']})\n"
-            f"Description: {system.description}\n"
-            f"Reachable Systems: {travel_options}\n"
+        lines += (
+            f"\n--- Current Location: {system.name} ({system.economy_type})",
+            f"System Faction: {system.faction} ({FACTIONS[system.faction]['name']})",
+            f"Description: {system.description}",
+            f"Reachable Systems: {travel_options}",
         )
-        if system.name in self.game.galaxy.active_events:
-            event = self.game.galaxy.active_events[system.name]
-            status += f"EVENT: This system is experiencing a {event['type']}!\n"
+        event = self.game.galaxy.active_events.get(system.name)
+        if event is not None:
+            add(f"EVENT: This system is experiencing a {event['type']}!")
         
-        status += (
-            f"\n--- Ship: {ship.name} ({ship.ship_class_data['name']}) ---\n"
-            f"Level: {ship.level}"
-        )
+        add(f"\n--- Ship: {ship.name} ({ship.ship_class_data['name']}) ---")
         if ship.specialization:
-            status += f" | Specialization: {ship.specialization.title()}\n"
+            add(f"Level: {ship.level} | Specialization: {ship.specialization.title()}")
         else:
-            status += "\n"
-        status += (
-            f"Experience: Trading {ship.experience['trading']} | Combat {ship.experience['combat']} | Exploration {ship.experience['exploration']}\n"
-            f"Hull: {ship.hull}/{ship.max_hull}\n"
-            f"Fuel: {ship.fuel}/{ship.max_fuel}\n"
-            f"Cargo ({ship.get_cargo_used()}/{ship.cargo_capacity}): {cargo_list}\n"
-            f"Weapon Damage: {ship.get_weapon_damage(self.game.player)}\n"
-            f"Shield Strength: {ship.get_shield_strength()}\n"
-            f"Fuel Efficiency: {ship.get_fuel_efficiency(self.game.player)}\n"
-            f"\n--- Installed Modules ---\n"
+            add(f"Level: {ship.level}")
+        experience = ship.experience
+        lines += (
+            f"Experience: Trading {experience['trading']} | Combat {experience['combat']} | Exploration {experience['exploration']}",
+            f"Hull: {ship.hull}/{ship.max_hull}",
+            f"Fuel: {ship.fuel}/{ship.max_fuel}",
+            f"Cargo ({ship.get_cargo_used()}/{ship.cargo_capacity}): {cargo_list}",
+            f"Weapon Damage: {ship.get_weapon_damage(player)}",
+            f"Shield Strength: {ship.get_shield_strength()}",
+            f"Fuel Efficiency: {ship.get_fuel_efficiency(player)}",
+            "\n--- Installed Modules ---",
         )
         if ship.modules:
-            for module_name in ship.modules:
-                status += f"  - {module_name}\n"
+            lines += (f"  - {module_name}" for module_name in ship.modules)
         else:
-            status += "  None\n"
+            add("  None")
 
-        if self.game.player.crew:
-            status += "\n--- Crew ---\n"
-            for member in self.game.player.crew:
-                status += f"- {member.name} ({member.role}) | Morale: {member.morale}% | Experience: {member.experience} | Bonus: {member.skill_bonus:.2f}\n"
+        if player.crew:
+            add("\n--- Crew ---")
+            lines += (
+                f"- {member.name} ({member.role}) | Morale: {member.morale}% | Experience: {member.experience} | Bonus: {member.skill_bonus:.2f}"
+                for member in player.crew
+            )
 
-        if self.game.player.active_missions:
-            status += f"\n--- Active Missions (Day {self.game.current_day}) ---\n"
-            for mission in self.game.player.active_missions:
-                status += f"- ID: {mission.id} | {mission.get_description()} (Expires: Day {mission.expiration_day})\n"
+        if player.active_missions:
+            add(f"\n--- Active Missions (Day {self.game.current_day}) ---")
+            lines += (
+                f"- ID: {mission.id} | {mission.get_description()} (Expires: Day {mission.expiration_day})"
+                for mission in player.active_missions
+            )
             
-        return status
+        # Every line of the display ends with a newline
+        lines.append("")
+        return "\n".join(lines)
     
     def display_status(self) -> None:
         """Print the player's status to the console."""
@@ -494,8 +494,9 @@ class TestStarTrader(unittest.TestCase):
         self.assertEqual(self.game.player.ship.get_cargo_used(), initial_cargo + 10)
         
         # 3. Travel to the destination
-        with patch('sys.stdout', new=io.StringIO()):
-            self.run_command("travel sirius")
+        with patch('random.random', return_value=1.0):  # Prevent random events
+            with patch('sys.stdout', new=io.StringIO()):
+                self.run_command("travel sirius")
         
         self.assertEqual(self.game.player.location.name, "Sirius")
         
@@ -686,8 +687,9 @@ class TestStarTrader(unittest.TestCase):
         self.assertIn(bounty_mission, self.game.player.active_missions)
         
         # 2. Travel to the target system
-        with patch('sys.stdout', new=io.StringIO()):
-            self.run_command(' '.join(["travel", "sirius"]))
+        with patch('random.random', return_value=1.0):  # Prevent random events
+            with patch('sys.stdout', new=io.StringIO()):
+                self.run_command(' '.join(["travel", "sirius"]))
             
         self.assertEqual(self.game.player.location.name, "Sirius")
 
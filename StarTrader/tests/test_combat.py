@@ -67,4 +67,17 @@ class TestCombat(BaseStarTraderTest):
                 if distance == 1 and hull_percent <= 0.3:
                     boardable.append(e)
         
-        self.assertEqual(len(boardable), 1)  # Should be able to board the enemy
\ No newline at end of file
+        self.assertEqual(len(boardable), 1)  # Should be able to board the enemy
+
+    def test_tactical_combat_command_rewards(self):
+        """Test that winning the combat demo pays salvage per enemy."""
+        initial_credits = self.game.player.credits
+        with patch('startrader.main.TacticalCombat.run', return_value="victory"):
+            with patch('sys.stdout', new=io.StringIO()):
+                self.run_command("combat multi")
+
+        earned = self.game.player.credits - initial_credits
+        self.assertGreaterEqual(earned, 300 * 2)
+        self.assertLessEqual(earned, 600 * 2)
+        self.assertEqual(earned % 2, 0)
+        self.assertFalse(self.game.game_over)
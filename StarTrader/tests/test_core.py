@@ -4,6 +4,8 @@ Core game functionality tests.
 Tests for basic game initialization, galaxy creation, and player state.
 """
 
+from unittest.mock import patch
+import io
 import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -41,4 +43,71 @@ class TestCoreGame(BaseStarTraderTest):
         self.assertEqual(self.game.galaxy.systems["Sol"].faction, "Federation")
         self.assertEqual(self.game.galaxy.systems["Sirius"].faction, "Syndicate")
         self.assertIn("Federation", self.game.player.reputation)
-        self.assertEqual(self.game.player.reputation["Federation"], 0)
\ No newline at end of file
+        self.assertEqual(self.game.player.reputation["Federation"], 0)
+
+    def test_cargo_used_counter(self):
+        """Test that the running cargo total and sorted view track adds, removes and reloads."""
+        ship = self.game.player.ship
+        ship.add_cargo("Food", 5)
+        ship.add_cargo("Minerals", 3)
+        ship.remove_cargo("Food", 2)
+        self.assertEqual(ship.get_cargo_used(), 6)
+        ship.remove_cargo("Minerals", 10)  # Over-removal clears the entry
+        self.assertEqual(ship.cargo_used, 3)
+        self.assertNotIn("Minerals", ship.cargo_hold)
+        ship.cargo_hold = {"Medicine": 4, "Food": 1}
+        self.assertEqual(ship.get_cargo_used(), 5)
+        ship.add_cargo("Electronics", 2)
+        ship.remove_cargo("Medicine", 4)
+        self.assertEqual(ship.sorted_cargo(), [("Electronics", 2), ("Food", 1)])
+
+    def test_galaxy_connections(self):
+        """Test that connections are mutual and every link has a fuel cost."""
+        galaxy = self.game.galaxy
+        for name, neighbors in galaxy.connections.items():
+            self.assertTrue(neighbors)  # Isolated systems get no entry
+            for neighbor in neighbors:
+                self.assertIn(name, galaxy.connections[neighbor])
+                self.assertGreater(galaxy.fuel_costs[(name, neighbor)], 0)
+
+    def test_base_price_multipliers(self):
+        """Test the precomputed economy price multiplier tables."""
+        galaxy = self.game.galaxy
+        agricultural = galaxy._economy_price_multipliers("Agricultural")
+        self.assertEqual(agricultural["Food"], 0.6)
+        self.assertEqual(agricultural["Minerals"], 1.5)
+        self.assertEqual(galaxy._economy_price_multipliers("Industrial")["Food"], 1.4)
+        self.assertEqual(galaxy._economy_price_multipliers("Mining")["Minerals"], 0.5)
+        self.assertEqual(galaxy._economy_price_multipliers("Core")["Medicine"], 1.0)
+        # Economies outside the precomputed set still get a full table
+        self.assertEqual(galaxy._economy_price_multipliers("Frontier")["Machinery"], 1.3)
+
+    def test_lazy_handlers_follow_new_game(self):
+        """Test that lazily built handlers are rebuilt for a new game."""
+        self.assertNotIn("captain_commands", vars(self.game))
+        old_handler = self.game.captain_commands
+        self.assertIs(old_handler.player, self.game.player)
+
+        with patch('sys.stdout', new=io.StringIO()):
+            self.run_command("new")
+        self.assertIsNot(self.game.captain_commands, old_handler)
+        self.assertIs(self.game.captain_commands.player, self.game.player)
+
+    def test_hire_and_fire_crew(self):
+        """Test that hiring and firing move the chosen crew member."""
+        from startrader.classes import CrewMember
+        first = CrewMember("Ann Vega", "Pilot", 0.1, 50, "A steady hand.")
+        second = CrewMember("Bo Reyes", "Engineer", 0.1, 60, "Keeps the engines running.")
+        first.hire_cost = second.hire_cost = 100
+        self.game.available_recruits = [first, second]
+        self.give_player_credits(1000)
+
+        self.assertCommandOutput("hire 2", "Hired Bo Reyes as Engineer")
+        self.assertIs(self.game.available_recruits[0], first)
+        self.assertNotIn(second, self.game.available_recruits)
+        self.assertEqual(self.game.player.crew, [second])
+        self.assertEqual(self.game.player.credits, 900)
+
+        with patch('builtins.input', return_value='y'):
+            self.assertCommandOutput("fire 1", "Bo Reyes has been dismissed.")
+        self.assertEqual(self.game.player.crew, [])
@@ -48,6 +48,25 @@ class TestEvents(BaseStarTraderTest):
 
         self.assertEqual(self.game.player.ship.hull, initial_hull - 10)
 
+    def test_asteroid_safe_route_without_fuel(self):
+        """Test that the safe route falls back to the direct route exactly once."""
+        self.game.player.ship.fuel = 2
+        initial_hull = self.game.player.ship.hull
+        event_manager = self.game.event_manager
+        
+        # Choose option 1 (safe route) with too little fuel and force a failed dodge
+        with patch('builtins.input', return_value='1'):
+            with patch('random.random', return_value=0.9):
+                with patch('random.randint', return_value=10):
+                    with patch('sys.stdout', new=io.StringIO()) as fake_out:
+                        event_manager.trigger_event('asteroid_field')
+                        output = fake_out.getvalue()
+
+        self.assertIn("Forced to go direct", output)
+        self.assertEqual(output.count("You clip several asteroids!"), 1)
+        self.assertEqual(self.game.player.ship.fuel, 2)
+        self.assertEqual(self.game.player.ship.hull, initial_hull - 10)
+
     def test_economic_event_famine(self):
         """Test the effect of a famine event on market prices."""
         # Trigger a famine in Sirius
@@ -61,6 +80,22 @@ class TestEvents(BaseStarTraderTest):
         # Price of food in the famine system should be dramatically higher
         self.assertGreater(sirius_market["Food"]["price"], initial_price)
 
+    def test_market_drift_without_events(self):
+        """Test that prices with no events drift a quarter of the way to their resting price."""
+        galaxy = self.game.galaxy
+        galaxy.active_events.clear()
+        galaxy.galactic_events.clear()
+        sol_market = galaxy.systems["Sol"].market
+        sol_market["Minerals"]["price"] = 700  # Resting price in a Core system is 300
+        sol_market["Food"]["price"] = 100      # Resting price in a Core system is 140
+        
+        with patch('random.random', return_value=1.0):  # No new galactic events
+            with patch('sys.stdout', new=io.StringIO()):
+                galaxy.update_markets()
+        
+        self.assertEqual(sol_market["Minerals"]["price"], 600)
+        self.assertEqual(sol_market["Food"]["price"], 110)
+
     def test_news_command(self):
         """Tests the news command to ensure it reports events and bounties."""
         # 1. Create a famine event
@@ -77,4 +112,41 @@ class TestEvents(BaseStarTraderTest):
             output = fake_out.getvalue()
             
             self.assertIn("A severe famine continues in the Sirius system.", output)
-            self.assertIn("WANTED: The pirate Red-Eye is wanted by the Federation.", output)
\ No newline at end of file
+            self.assertIn("WANTED: The pirate Red-Eye is wanted by the Federation.", output)
+
+    def test_bounty_hunter_reprompts_invalid_choice(self):
+        """Test that an invalid bounty hunter choice asks again instead of fighting."""
+        self.game.player.wanted_by["Federation"] = 3  # Enough to draw a hunter
+        with patch('builtins.input', side_effect=["x", "4"]) as fake_input:
+            with patch('sys.stdout', new=io.StringIO()) as fake_out:
+                self.game.event_manager.trigger_event('bounty_hunter')
+                output = fake_out.getvalue()
+        
+        self.assertEqual(fake_input.call_count, 2)
+        self.assertIn("Please choose one of the listed options.", output)
+        self.assertIn("--- COMBAT:", output)
+
+    def test_customs_bribe_reprompts_until_yes_or_no(self):
+        """Test that the customs bribe prompt keeps asking until it gets y or n."""
+        self.game.player.credits = 100000
+        self.game.player.ship.add_cargo("Drugs", 1)
+        with patch('builtins.input', side_effect=["maybe", "n"]) as fake_input:
+            with patch('random.random', return_value=0.0):  # Guarantee the scan
+                with patch('sys.stdout', new=io.StringIO()) as fake_out:
+                    self.game.event_manager.trigger_event('customs_scan')
+                    output = fake_out.getvalue()
+        
+        self.assertEqual(fake_input.call_count, 2)
+        self.assertIn("Please choose one of the listed options.", output)
+        self.assertIn("Your 1 units of Drugs have been confiscated!", output)
+        self.assertNotIn("Drugs", self.game.player.ship.cargo_hold)
+        self.assertEqual(self.game.player.credits, 100000 - 6000)
+
+        # A full word counts by its first letter
+        self.game.player.ship.add_cargo("Drugs", 1)
+        with patch('builtins.input', side_effect=["Yes"]):
+            with patch('random.random', return_value=0.0):  # Scan and bribe both succeed
+                with patch('sys.stdout', new=io.StringIO()) as fake_out:
+                    self.game.event_manager.trigger_event('customs_scan')
+                    self.assertIn("pockets the credits", fake_out.getvalue())
+        self.assertIn("Drugs", self.game.player.ship.cargo_hold)
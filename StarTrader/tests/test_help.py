@@ -0,0 +1,47 @@
+"""
+Help system tests.
+
+Tests for command help, mechanics explanations, and command suggestions.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from tests.test_utils import BaseStarTraderTest
+
+
+class TestHelp(BaseStarTraderTest):
+    """Tests for the help system."""
+
+    def test_help_topics(self):
+        """Test general, command, and mechanics help output."""
+        output = self.assertCommandOutput("help", "--- Star Trader Help ---")
+        self.assertIn("Factories:\n  buildfactory, factories", output)
+        self.assertCommandOutput("help BUY", "buy: buy <good> <quantity>")
+        self.assertCommandOutput("help mechanics", "  - victory")
+        self.assertCommandOutput("help mechanics Combat", "--- COMBAT MECHANICS ---")
+        self.assertCommandFails("help mechanics bogus", "Unknown mechanics topic: bogus")
+
+    def test_command_list(self):
+        """Test that every listed command has help text."""
+        help_system = self.game.help_system
+        commands = help_system.get_command_list()
+        self.assertIn("travel", commands)
+        for command in commands:
+            self.assertIsNotNone(help_system.get_command_help_text(command))
+
+    def test_unknown_command_suggestions(self):
+        """Test that unknown commands suggest the commands they prefix."""
+        output = self.assertCommandOutput("help fact", "No help available for 'fact'")
+        self.assertIn("Factories: factories, factorysupply, factorycollect, factoryupgrade", output)
+        output = self.assertCommandOutput("help xyz", "No help available for 'xyz'")
+        self.assertNotIn("Try one of", output)
+
+    def test_prefix_matches(self):
+        """Test trie prefix lookup and its result limit."""
+        from startrader.help_system import _prefix_matches
+        self.assertEqual(_prefix_matches("hire"), ["hire", "hirecaptain", "hirefactorymanager"])
+        self.assertEqual(_prefix_matches("sw"), ["switchship"])
+        self.assertEqual(_prefix_matches("s"), ["sell", "status", "shipyard", "switchship", "sellmodule"])
+        self.assertEqual(len(_prefix_matches("s", limit=20)), 9)
+        self.assertEqual(_prefix_matches("zz"), [])
@@ -121,4 +121,17 @@ class TestIntegration(BaseStarTraderTest):
         self.assertEqual(self.game.player.ship.get_cargo_used(), 5)
 
         # Clean up the save file
-        os.remove("savegame.json")
\ No newline at end of file
+        os.remove("savegame.json")
+
+    def test_run_loop_splits_on_any_whitespace(self):
+        """Tests that the main loop finds the verb however the words are separated."""
+        commands = ["travel\tsirius", "", "quit"]
+        with patch('builtins.input', side_effect=commands), \
+             patch('random.random', return_value=1.0), \
+             patch('time.sleep'), \
+             patch('sys.stdout', new=io.StringIO()) as fake_out:
+            self.game.run()
+
+        self.assertEqual(self.game.player.location.name, "Sirius")
+        self.assertIn("Unknown command: ''", fake_out.getvalue())
+        self.assertTrue(self.game.game_over)
@@ -59,4 +59,44 @@ class TestNavigation(BaseStarTraderTest):
                 self.run_command(' '.join(["travel", "alpha", "centauri"]))
         
         self.assertEqual(self.game.player.ship.fuel, initial_fuel - fuel_cost_base)
-        self.assertEqual(self.game.player.location.name, "Alpha Centauri")
\ No newline at end of file
+        self.assertEqual(self.game.player.location.name, "Alpha Centauri")
+
+    def test_explore_discovery_keeps_existing_markets(self):
+        """Test that discovering a system stocks its market without re-rolling others."""
+        sol_market = {good: dict(data) for good, data in self.game.galaxy.systems["Sol"].market.items()}
+
+        with patch('random.random', return_value=0.0):  # Guarantee a discovery
+            with patch('sys.stdout', new=io.StringIO()) as fake_out:
+                self.run_command("explore")
+                self.assertIn("DISCOVERY", fake_out.getvalue())
+
+        discovered = [s for s in self.game.galaxy.uncharted_systems.values() if s.discovered]
+        self.assertEqual(len(discovered), 1)
+        self.assertIn("Food", discovered[0].market)
+        self.assertEqual(self.game.galaxy.systems["Sol"].market, sol_market)
+
+    def test_scan_detection_range(self):
+        """Test that scanning detects undiscovered systems up to 3 units away."""
+        sol = self.game.galaxy.systems["Sol"]
+        uncharted = list(self.game.galaxy.uncharted_systems.values())
+        for system in uncharted:
+            system.x, system.y = sol.x + 8, sol.y + 8  # Well out of range
+        
+        # 3 units along one axis is exactly at the edge of sensor range
+        uncharted[0].x, uncharted[0].y = sol.x + 3, sol.y
+        self.assertCommandOutput("scan", "Anomaly detected 3.0 units away")
+        
+        # One step diagonally beyond that is out of range
+        uncharted[0].y = sol.y + 1
+        self.assertCommandOutput("scan", "No anomalies detected")
+
+    def test_find_system_name(self):
+        """Test short system names, including systems discovered later."""
+        galaxy = self.game.galaxy
+        self.assertEqual(galaxy.find_system_name("CENTAURI"), "Alpha Centauri")
+        self.assertIsNone(galaxy.find_system_name("betelgeuse"))
+
+        system = next(iter(galaxy.uncharted_systems.values()))
+        self.assertIsNone(galaxy.find_system_name(system.name))
+        galaxy.add_discovered_system(system, galaxy.systems["Sol"])
+        self.assertEqual(galaxy.find_system_name(system.name.lower()), system.name)
@@ -29,4 +29,18 @@ class TestReputation(BaseStarTraderTest):
         with patch('sys.stdout', new=io.StringIO()):
             self.run_command(' '.join(["sell", "food", "1"]))
 
-        self.assertEqual(self.game.player.reputation["Federation"], initial_rep + 1)
\ No newline at end of file
+        self.assertEqual(self.game.player.reputation["Federation"], initial_rep + 1)
+
+    def test_wanted_level_stars(self):
+        """Test wanted level increases and their star display."""
+        player = self.game.player
+        with patch('sys.stdout', new=io.StringIO()) as fake_out:
+            player.increase_wanted_level("Federation", 2)
+            player.increase_wanted_level(amount=9)
+            output = fake_out.getvalue()
+        self.assertIn("Wanted level: ★★\n", output)
+        self.assertIn("Wanted level: ★★★★★\n", output)
+        self.assertEqual(player.wanted_level, 5)
+        from startrader.classes import WANTED_STARS
+        self.assertEqual(WANTED_STARS[0], "")
+        self.assertEqual(WANTED_STARS[player.wanted_level], "★★★★★")
@@ -107,4 +107,40 @@ class TestTrading(BaseStarTraderTest):
         with patch('sys.stdout', new=io.StringIO()):
             self.run_command(' '.join(["sell", "minerals", "20"]))
 
-        self.assertLess(sol_market["Minerals"]["price"], initial_price)
\ No newline at end of file
+        self.assertLess(sol_market["Minerals"]["price"], initial_price)
+
+    def test_factory_manager_restocks_inputs(self):
+        """Test that a managed factory tops its inputs up to three batches."""
+        from startrader.classes import Factory
+        factory = Factory("Sol", "Alloys", 1)
+        factory.manager = "Manager"
+        factory.add_input("Minerals", 4)
+        self.game.player.factories.append(factory)
+        self.game.player.credits = 10000
+
+        sol_market = self.game.galaxy.systems["Sol"].market
+        sol_market["Minerals"] = {"price": 10, "quantity": 100}
+        sol_market["Energy"] = {"price": 20, "quantity": 2}
+
+        self.game.galaxy.process_factories(self.game.player)
+
+        # Minerals: 3 batches of 3 = 9, minus the 4 in storage
+        self.assertEqual(factory.storage["Minerals"], 9)
+        self.assertEqual(sol_market["Minerals"]["quantity"], 95)
+        # Energy: wants 3 but only 2 are on the market
+        self.assertEqual(factory.storage["Energy"], 2)
+        self.assertEqual(sol_market["Energy"]["quantity"], 0)
+        self.assertEqual(self.game.player.credits, 10000 - factory.daily_cost - 5 * 10 - 2 * 20)
+
+    def test_trade_bonus_sources(self):
+        """Test that trade bonus messages follow the bonus sources."""
+        self.game.player.credits = 5000
+        self.game.player.skills["negotiation"] = 10
+        self.assertEqual(self.game.get_trade_bonus_sources(), (0, 0.1, 0))
+        self.assertEqual(self.game.calculate_trade_bonus(), 0.1)
+
+        with patch('sys.stdout', new=io.StringIO()) as fake_out:
+            self.run_command("buy food 10")
+            output = fake_out.getvalue()
+        self.assertIn("Your negotiation skills save you", output)
+        self.assertNotIn("trading ship", output)